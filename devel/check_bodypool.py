@@ -0,0 +1,67 @@
+"""
+Check that BodyPool.step() gives the same result as calling apply_gravity(),
+update(), check_wall_collision() and check_ground_collision() in turn.
+
+Two pools start from the same random state, with bodies placed so that many
+of them hit the walls and the floor. One pool runs the four separate calls
+and the other runs step(). After every frame their positions and velocities
+must match.
+
+Run with: python devel/check_bodypool.py
+"""
+
+import numpy as np
+from orbitlib.bodypool import BodyPool
+
+WIDTH = 800
+HEIGHT = 600
+SIZE = 6
+GRAVITY = 300.0
+D_T = 1 / 60
+FRAMES = 600
+
+
+def make_pools(n, seed=1):
+    """Return two pools of n bodies with the same random starting state."""
+    rng = np.random.default_rng(seed)
+    pos = np.column_stack([rng.uniform(-20, WIDTH + 20, n), rng.uniform(0, HEIGHT + 20, n)])
+    vel = rng.uniform(-400, 400, (n, 2))
+
+    pools = BodyPool(n, size=SIZE), BodyPool(n, size=SIZE)
+    for pool in pools:
+        pool.pos[:] = pos
+        pool.vel[:] = vel
+    return pools
+
+
+def check(elasticity, n=1000):
+    """Run both paths for FRAMES frames and compare them after each one."""
+    separate, fused = make_pools(n)
+
+    for frame in range(FRAMES):
+        separate.apply_gravity(GRAVITY)
+        separate.update(D_T)
+        separate.check_wall_collision(WIDTH, elasticity)
+        separate.check_ground_collision(HEIGHT, elasticity)
+
+        fused.step(GRAVITY, WIDTH, HEIGHT, D_T, elasticity)
+
+        if not (np.allclose(separate.pos, fused.pos, rtol=1e-5, atol=1e-3)
+                and np.allclose(separate.vel, fused.vel, rtol=1e-5, atol=1e-3)):
+            pos_err = np.abs(separate.pos - fused.pos).max()
+            vel_err = np.abs(separate.vel - fused.vel).max()
+            raise AssertionError(f"elasticity {elasticity}: frame {frame} differs, "
+                                 f"max position error {pos_err}, max velocity error {vel_err}")
+
+    exact = np.array_equal(separate.pos, fused.pos) and np.array_equal(separate.vel, fused.vel)
+    print(f"elasticity {elasticity}: {FRAMES} frames match"
+          + (" exactly" if exact else " to float32 rounding"))
+
+
+def main():
+    for elasticity in (1.0, 0.8):
+        check(elasticity)
+
+
+if __name__ == "__main__":
+    main()
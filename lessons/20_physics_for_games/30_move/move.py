@@ -14,6 +14,8 @@ WIDTH = 600
 HEIGHT = 600
 SIZE = 50  # Square size in pixels
 D_X = 5  # Pixels per frame (simple, not time-based)
+MAX_X = WIDTH - SIZE   # Furthest right the square can go
+MAX_Y = HEIGHT - SIZE  # Furthest down the square can go
 
 # Colors (R, G, B)
 BACKGROUND = (255, 255, 255)      # White
@@ -26,38 +28,49 @@ pygame.display.set_caption("Move the Square")
 clock = pygame.time.Clock()
 FPS = 60  # Frames per second (keeps things from running too fast)
 
+# Draw the square once, then copy (blit) it to the screen each frame
+square = pygame.Surface((SIZE, SIZE)).convert()
+square.fill(SQUARE_COLOR)
+
 # Start in the center
 x = WIDTH // 2 - SIZE // 2
 y = HEIGHT // 2 - SIZE // 2
 
+# Velocity in pixels per frame, set from the arrow keys
+v_x = 0
+v_y = 0
+
+# Only the part of the screen that changed is redrawn each frame. The first
+# frame redraws the whole screen.
+old_rect = screen.get_rect()
+
 running = True
 while running:
     # Handle events (like closing the window)
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
-
-    # Key state (which keys are held down)
-    keys = pygame.key.get_pressed()
+        elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            # The keys only change when there is a key event, so this is the
+            # only time the velocity needs to be worked out again
+            keys = pygame.key.get_pressed()
+            v_x = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * D_X
+            v_y = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * D_X
 
     # Update position
-    if keys[pygame.K_LEFT]:
-        x -= D_X
-    if keys[pygame.K_RIGHT]:
-        x += D_X
-    if keys[pygame.K_UP]:
-        y -= D_X
-    if keys[pygame.K_DOWN]:
-        y += D_X
+    x += v_x
+    y += v_y
 
     # Keep square on screen
-    x = max(0, min(WIDTH - SIZE, x))
-    y = max(0, min(HEIGHT - SIZE, y))
+    x = 0 if x < 0 else (MAX_X if x > MAX_X else x)
+    y = 0 if y < 0 else (MAX_Y if y > MAX_Y else y)
 
     # Draw
-    screen.fill(BACKGROUND)
-    pygame.draw.rect(screen, SQUARE_COLOR, (x, y, SIZE, SIZE))
-    pygame.display.flip()
+    # Erase the square where it was, then draw it where it is now
+    screen.fill(BACKGROUND, old_rect)
+    new_rect = screen.blit(square, (x, y))
+    pygame.display.update([old_rect, new_rect])
+    old_rect = new_rect
 
     # Slow the loop to ~FPS frames per second
     clock.tick(FPS)
@@ -26,11 +26,19 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Back and Forth (No Acceleration)")
 clock = pygame.time.Clock()
 
+# Draw the square once, then copy (blit) it to the screen each frame
+square = pygame.Surface((SIZE, SIZE)).convert()
+square.fill(SQUARE_COLOR)
+
 # Start at left edge, vertically centered
 x = 0
 y = HEIGHT // 2 - SIZE // 2
 direction = 1  # 1 moves right, -1 moves left
 
+# Only the part of the screen that changed is redrawn each frame. The first
+# frame redraws the whole screen.
+old_rect = screen.get_rect()
+
 running = True
 while running:
     # Handle window events
@@ -48,9 +56,11 @@ while running:
         direction = 1
 
     # Draw frame
-    screen.fill(BACKGROUND)
-    pygame.draw.rect(screen, SQUARE_COLOR, (x, y, SIZE, SIZE))
-    pygame.display.flip()
+    # Erase the square where it was, then draw it where it is now
+    screen.fill(BACKGROUND, old_rect)
+    new_rect = screen.blit(square, (x, y))
+    pygame.display.update([old_rect, new_rect])
+    old_rect = new_rect
 
     # Control frame rate
     clock.tick(FPS)
@@ -21,6 +21,7 @@ JUMP_VELOCITY = 200.0   # pixels / second upward (we'll negate it)
 GRAVITY = 60.0          # pixels / second^2 downward
 FPS = 30
 DT = 1 / FPS            # seconds per frame
+DV_Y = GRAVITY * DT     # change in velocity from gravity each frame
 
 BACKGROUND = Colors.WHITE
 PLAYER_COLOR = Colors.BLACK
@@ -31,12 +32,20 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Gravity Jump")
 clock = pygame.time.Clock()
 
+# Draw the player once, then copy (blit) it to the screen each frame
+player = pygame.Surface((SIZE, SIZE)).convert()
+player.fill(PLAYER_COLOR)
+
 # --- Initial state ---
 x = PLAYER_X
 y = HEIGHT - SIZE           # start on the "ground"
 v_y = 0.0                   # vertical velocity
 is_jumping = False          # track if we are mid-jump
 
+# Only the part of the screen that changed is redrawn each frame. The first
+# frame redraws the whole screen.
+old_rect = screen.get_rect()
+
 running = True
 while running:
     # Handle quit events
@@ -51,7 +60,7 @@ while running:
         is_jumping = True
 
     # Gravity accelerates downward (adds to velocity)
-    v_y += GRAVITY * DT
+    v_y += DV_Y            # same as v_y += GRAVITY * DT
     y += v_y * DT
 
     # Ground collision
@@ -61,9 +70,11 @@ while running:
         is_jumping = False    # ready to jump again next frame
 
     # --- Draw ---
-    screen.fill(BACKGROUND)
-    pygame.draw.rect(screen, PLAYER_COLOR, (x, y, SIZE, SIZE))
-    pygame.display.flip()
+    # Erase the player where it was, then draw it where it is now
+    screen.fill(BACKGROUND, old_rect)
+    new_rect = screen.blit(player, (x, y))
+    pygame.display.update([old_rect, new_rect])
+    old_rect = new_rect
 
     clock.tick(FPS)
 
@@ -33,6 +33,10 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Acceleration (Spring)")
 clock = pygame.time.Clock()
 
+# Draw the square once, then copy (blit) it to the screen each frame
+square = pygame.Surface((SIZE, SIZE)).convert()
+square.fill(SQUARE_COLOR)
+
 # Start a little off-center so motion begins
 x = 20.0
 y = HEIGHT // 2 - SIZE // 2
@@ -41,6 +45,10 @@ v_x = 0.0  # velocity (pixels / second)
 center_x = (WIDTH - SIZE) // 2            # equilibrium x position
 center_y = (HEIGHT - SIZE) // 2 + SIZE // 2  # y center (circle & line anchor)
 
+# Only the parts of the screen that changed are redrawn each frame. The first
+# frame redraws the whole screen.
+old_rects = [screen.get_rect()]
+
 running = True
 while running:
     # Handle events
@@ -58,18 +66,24 @@ while running:
     x += v_x * DT                  # update position
 
     # --- Draw ---
-    screen.fill(BACKGROUND)
+    # Erase what was drawn last frame
+    for rect in old_rects:
+        screen.fill(BACKGROUND, rect)
 
     # Draw blue line from center to square center (visualize displacement)
     square_center = (x + SIZE / 2, y + SIZE / 2)
-    pygame.draw.line(screen, LINE_COLOR, (center_x + SIZE / 2, center_y), square_center, 3)
+    line_rect = pygame.draw.line(screen, LINE_COLOR, (center_x + SIZE / 2, center_y), square_center, 3)
 
     # Draw green center point (equilibrium)
-    pygame.draw.circle(screen, CENTER_COLOR, (int(center_x + SIZE / 2), int(center_y)), 8)
+    center_rect = pygame.draw.circle(screen, CENTER_COLOR, (int(center_x + SIZE / 2), int(center_y)), 8)
 
     # Draw the moving square last so it sits on top
-    pygame.draw.rect(screen, SQUARE_COLOR, (x, y, SIZE, SIZE))
-    pygame.display.flip()
+    square_rect = screen.blit(square, (x, y))
+
+    # Update only the parts of the display that changed
+    new_rects = [line_rect, center_rect, square_rect]
+    pygame.display.update(old_rects + new_rects)
+    old_rects = new_rects
 
     clock.tick(FPS)
 
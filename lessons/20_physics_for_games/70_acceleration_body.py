@@ -14,11 +14,9 @@ name: Acceleration Body
 """
 
 import pygame
-from dataclasses import dataclass
 from orbitlib.colors import Colors
 
 
-@dataclass
 class Settings:
     """Class to hold all game settings and constants."""
 
@@ -38,14 +36,18 @@ class Settings:
     BACKGROUND_COLOR: tuple[int, int, int] = Colors.BLACK
     FPS: int = 60
 
-    def __post_init__(self):
-        """Calculate derived values after initialization."""
-        self.d_t = 1 / self.FPS  # Time step for physics calculations
+    # Time step settings. The physics always steps by d_t, no matter how fast
+    # frames are drawn, so a slow frame can't make the spring unstable.
+    PHYSICS_HZ: int = 240  # Physics steps per second
+    d_t: float = 1 / PHYSICS_HZ  # Time step for physics calculations
+    MAX_FRAME_TIME: float = 0.25  # Longest frame time the physics catches up on, in seconds
 
 
 class Body:
     """Class representing a physical body with position, velocity, and acceleration."""
 
+    __slots__ = ("x", "y", "v_x", "v_y", "a_x", "a_y", "mass", "settings", "sprite")
+
     def __init__(
         self,
         x: float,
@@ -65,8 +67,16 @@ class Body:
         self.mass = mass
         self.settings = settings
 
+        # Draw the square once, then copy (blit) it to the screen each frame
+        self.sprite = pygame.Surface((settings.SQUARE_SIZE, settings.SQUARE_SIZE)).convert()
+        self.sprite.fill(settings.SQUARE_COLOR)
+
     def apply_spring_force(self, t_x: float, t_y: float, k: float):
-        """Apply spring force toward a target position."""
+        """Apply spring force toward a target position.
+
+        This sets the acceleration rather than adding to it, so it must be the
+        first force applied each frame.
+        """
         # Calculate displacement from target
         d_x = self.x - t_x
         d_y = self.y - t_y
@@ -81,25 +91,19 @@ class Body:
 
     def update(self):
         """Update the body's position and velocity based on acceleration."""
+        d_t = self.settings.d_t
+
         # Update velocity with acceleration
-        self.v_x += self.a_x * self.settings.d_t
-        self.v_y += self.a_y * self.settings.d_t
+        self.v_x += self.a_x * d_t
+        self.v_y += self.a_y * d_t
 
         # Update position with velocity
-        self.x += self.v_x * self.settings.d_t
-        self.y += self.v_y * self.settings.d_t
-
-        # Reset acceleration (forces need to be applied each frame)
-        self.a_x = 0.0
-        self.a_y = 0.0
+        self.x += self.v_x * d_t
+        self.y += self.v_y * d_t
 
     def draw(self, screen: pygame.Surface):
-        """Draw the body on the screen."""
-        pygame.draw.rect(
-            screen,
-            self.settings.SQUARE_COLOR,
-            (self.x, self.y, self.settings.SQUARE_SIZE, self.settings.SQUARE_SIZE),
-        )
+        """Draw the body on the screen and return the area it covers."""
+        return screen.blit(self.sprite, (self.x, self.y))
 
 
 class Simulation:
@@ -131,21 +135,33 @@ class Simulation:
         self.t_x = (self.settings.SCREEN_WIDTH - self.settings.SQUARE_SIZE) // 2
         self.t_y = (self.settings.SCREEN_HEIGHT - self.settings.SQUARE_SIZE) // 2
 
-    def update_physics(self):
-        """Update the physics simulation."""
-        # Apply spring force toward the center
-        self.body.apply_spring_force(self.t_x, self.t_y, self.settings.K)
+        # Area to redraw next frame; the first frame redraws the whole screen
+        self.old_rect = self.screen.get_rect()
+
+        # Real time, in seconds, that the physics hasn't simulated yet
+        self.accumulator = 0.0
+
+    def update_physics(self, frame_time: float):
+        """Run as many fixed physics steps as fit in the time since the last frame."""
+        d_t = self.settings.d_t
+        self.accumulator += min(frame_time, self.settings.MAX_FRAME_TIME)
+
+        while self.accumulator >= d_t:
+            # Apply spring force toward the center
+            self.body.apply_spring_force(self.t_x, self.t_y, self.settings.K)
+
+            # Update the body's physics
+            self.body.update()
 
-        # Update the body's physics
-        self.body.update()
+            self.accumulator -= d_t
 
     def draw(self):
         """Draw everything on the screen."""
-        # Clear the screen
-        self.screen.fill(self.settings.BACKGROUND_COLOR)
+        # Erase the body where it was last frame
+        self.screen.fill(self.settings.BACKGROUND_COLOR, self.old_rect)
 
         # Draw the body
-        self.body.draw(self.screen)
+        new_rect = self.body.draw(self.screen)
 
         # Optionally draw the target position as a small circle
         pygame.draw.circle(
@@ -158,8 +174,9 @@ class Simulation:
             5,
         )
 
-        # Update the display
-        pygame.display.flip()
+        # Update only the parts of the display that changed
+        pygame.display.update([self.old_rect, new_rect])
+        self.old_rect = new_rect
 
     def run(self):
         """Main simulation loop."""
@@ -172,8 +189,8 @@ class Simulation:
                 if event.type == pygame.QUIT:
                     running = False
 
-            # Update physics
-            self.update_physics()
+            # Update physics for the time the last frame took
+            self.update_physics(self.clock.get_time() / 1000)
 
             # Draw everything
             self.draw()
@@ -9,10 +9,9 @@ at the bottom that can be moved with arrow keys.
 
 import pygame
 import sys
-from dataclasses import dataclass
+from typing import NamedTuple
 
-@dataclass
-class Settings:
+class Settings(NamedTuple):
     # Screen settings
     SCREEN_WIDTH: int = 800
     SCREEN_HEIGHT: int = 600
@@ -50,6 +49,14 @@ screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
 pygame.display.set_caption("Gravity Bounce with Paddle")
 clock = pygame.time.Clock()
 
+# Draw the ball and paddle once, then copy (blit) them to the screen each frame
+ball_surf = pygame.Surface((2 * settings.BALL_RADIUS, 2 * settings.BALL_RADIUS), pygame.SRCALPHA)
+pygame.draw.circle(ball_surf, settings.RED, (settings.BALL_RADIUS, settings.BALL_RADIUS), settings.BALL_RADIUS)
+ball_surf = ball_surf.convert_alpha()
+
+paddle_surf = pygame.Surface((settings.PADDLE_WIDTH, settings.PADDLE_HEIGHT)).convert()
+paddle_surf.fill(settings.BLACK)
+
 # Ball properties
 ball_x = settings.SCREEN_WIDTH // 2
 ball_y = 50
@@ -59,6 +66,16 @@ velocity_y = settings.INITIAL_VELOCITY_Y
 # Paddle properties
 paddle_x = settings.SCREEN_WIDTH // 2 - settings.PADDLE_WIDTH // 2
 paddle_y = settings.SCREEN_HEIGHT - settings.PADDLE_HEIGHT
+paddle_step = settings.PADDLE_SPEED * settings.D_T  # How far the paddle moves each frame
+paddle_max_x = settings.SCREEN_WIDTH - settings.PADDLE_WIDTH
+
+# The keys that move the paddle
+K_LEFT = pygame.K_LEFT
+K_RIGHT = pygame.K_RIGHT
+
+# Only the parts of the screen that changed are redrawn each frame. The first
+# frame redraws the whole screen.
+old_rects = [screen.get_rect()]
 
 vm = 0
 # Main game loop
@@ -71,11 +88,14 @@ while running:
     
     # Handle paddle movement
     keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT] and paddle_x > 0:
-        paddle_x -= settings.PADDLE_SPEED * settings.D_T
+    left = keys[K_LEFT]
+    right = keys[K_RIGHT]
+
+    if left and paddle_x > 0:
+        paddle_x -= paddle_step
 
-    if keys[pygame.K_RIGHT] and paddle_x < settings.SCREEN_WIDTH - settings.PADDLE_WIDTH:
-        paddle_x += settings.PADDLE_SPEED * settings.D_T
+    if right and paddle_x < paddle_max_x:
+        paddle_x += paddle_step
     
     # Apply gravity
     velocity_y += settings.GRAVITY * settings.D_T
@@ -109,17 +129,20 @@ while running:
     
 
 
-    # Clear screen
-    screen.fill(settings.WHITE)
+    # Erase the ball and paddle where they were last frame
+    for rect in old_rects:
+        screen.fill(settings.WHITE, rect)
     
     # Draw ball
-    pygame.draw.circle(screen, settings.RED, (int(ball_x), int(ball_y)), settings.BALL_RADIUS)
+    ball_rect = screen.blit(ball_surf, (int(ball_x) - settings.BALL_RADIUS, int(ball_y) - settings.BALL_RADIUS))
     
     # Draw paddle
-    pygame.draw.rect(screen, settings.BLACK, (int(paddle_x), int(paddle_y), settings.PADDLE_WIDTH, settings.PADDLE_HEIGHT))
+    paddle_rect = screen.blit(paddle_surf, (int(paddle_x), int(paddle_y)))
     
-    # Update display
-    pygame.display.flip()
+    # Update only the parts of the display that changed
+    new_rects = [ball_rect, paddle_rect]
+    pygame.display.update(old_rects + new_rects)
+    old_rects = new_rects
     clock.tick(60)
 
 # Quit
@@ -0,0 +1,147 @@
+"""
+
+Many Bodies - Object Oriented Version
+
+Hundreds of squares falling under gravity and bouncing off the walls and the
+floor.
+
+Instead of one Body object per square, this program keeps all of the squares
+in a single BodyPool, from orbitlib. The pool stores every position and
+velocity in NumPy arrays, so one line of code moves all of the squares at
+once. Press SPACE to switch between the four separate steps (gravity, motion,
+walls, floor) and the pool's single compiled step(), which does the same
+work in one pass.
+
+"""
+
+import pygame
+from dataclasses import dataclass
+
+import numpy as np
+from orbitlib.bodypool import BodyPool
+from orbitlib.colors import Colors
+
+
+@dataclass
+class Settings:
+    """Class to hold all game settings and constants."""
+
+    # Screen settings
+    SCREEN_WIDTH: int = 800
+    SCREEN_HEIGHT: int = 600
+
+    # Body settings
+    NUM_BODIES: int = 500
+    BODY_SIZE: int = 6
+    BODY_COLOR = Colors.BLUE
+    MAX_SPEED: float = 200.0  # Fastest starting speed, in pixels per second
+
+    # Physics settings
+    GRAVITY: float = 300.0
+    ELASTICITY: float = 0.9  # Fraction of the speed kept after a bounce
+
+    # Display settings
+    BACKGROUND_COLOR = Colors.WHITE
+    FPS: int = 60
+    TIMESCALE: int = 1
+
+    def __post_init__(self):
+        """Calculate derived values after initialization."""
+        self.d_t = self.TIMESCALE / self.FPS  # Time step for physics calculations
+
+
+class Simulation:
+    """Class to handle the main simulation loop and coordinate the physics simulation."""
+
+    def __init__(self):
+        # Initialize Pygame
+        pygame.init()
+
+        # Create settings object
+        self.settings = Settings()
+
+        # Initialize the screen
+        self.screen = pygame.display.set_mode(
+            (self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT)
+        )
+        pygame.display.set_caption("Many Bodies")
+
+        # Clock to control the frame rate
+        self.clock = pygame.time.Clock()
+
+        # All of the bodies, starting at random places with random velocities
+        s = self.settings
+        self.pool = BodyPool(s.NUM_BODIES, size=s.BODY_SIZE, color=s.BODY_COLOR)
+        rng = np.random.default_rng()
+        self.pool.pos[:, 0] = rng.uniform(0, s.SCREEN_WIDTH - s.BODY_SIZE, s.NUM_BODIES)
+        self.pool.pos[:, 1] = rng.uniform(0, s.SCREEN_HEIGHT / 2, s.NUM_BODIES)
+        self.pool.vel[:] = rng.uniform(-s.MAX_SPEED, s.MAX_SPEED, (s.NUM_BODIES, 2))
+
+        # Use the single compiled step, or the four separate steps
+        self.use_step = True
+
+    def update(self):
+        """Update the physics simulation."""
+        s = self.settings
+
+        if self.use_step:
+            self.pool.step(s.GRAVITY, s.SCREEN_WIDTH, s.SCREEN_HEIGHT, s.d_t, s.ELASTICITY)
+        else:
+            # Apply forces to the bodies
+            self.pool.apply_gravity(s.GRAVITY)
+
+            # Move every body
+            self.pool.update(s.d_t)
+
+            # Handle collisions
+            self.pool.check_wall_collision(s.SCREEN_WIDTH, s.ELASTICITY)
+            self.pool.check_ground_collision(s.SCREEN_HEIGHT, s.ELASTICITY)
+
+    def draw(self):
+        """Draw everything on the screen."""
+        # Clear screen
+        self.screen.fill(self.settings.BACKGROUND_COLOR)
+
+        # Draw all bodies
+        self.pool.draw(self.screen)
+
+        # Update display
+        pygame.display.flip()
+
+    def run(self):
+        """Main simulation loop."""
+        running = True
+
+        while running:
+            # Event handling - REQUIRED
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    self.use_step = not self.use_step
+
+            # Update physics
+            self.update()
+
+            # Draw everything
+            self.draw()
+
+            # Show which physics path is running, and how fast
+            path = "step()" if self.use_step else "four steps"
+            pygame.display.set_caption(f"Many Bodies - {path} - {self.clock.get_fps():.0f} FPS")
+
+            # Frame rate control - REQUIRED
+            self.clock.tick(self.settings.FPS)
+
+        # Quit Pygame
+        pygame.quit()
+
+
+def main():
+    """Main function to start the simulation."""
+    simulation = Simulation()
+    simulation.run()
+
+
+if __name__ == "__main__":
+    main()
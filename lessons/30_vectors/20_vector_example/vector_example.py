@@ -38,6 +38,16 @@ class Simulation:
         pygame.display.set_caption(self.settings.WINDOW_TITLE)
         self.clock = pygame.time.Clock()
 
+        # The vectors to draw, head to tail. They never change, so they are
+        # made once here instead of every time the screen is drawn.
+        self.vectors = [
+            Vector20(8, 8),
+            Vector20(3, -12),
+            Vector20(-4, -2),
+            Vector20(-12, 0),
+            Vector20(0, 12),
+        ]
+
 
     def update(self):
         pass  # No dynamic update needed for static vector drawing
@@ -48,15 +58,7 @@ class Simulation:
 
         start = Vector20(0, 0) # Origin 
 
-        vectors = [
-            Vector20(8, 8),
-            Vector20(3, -12),
-            Vector20(-4, -2),
-            Vector20(-12, 0),
-            Vector20(0, 12),
-        ]
-
-        for v in vectors:
+        for v in self.vectors:
             start = draw_v20(self.screen, start, v)
 
         pygame.display.flip()
@@ -67,11 +69,15 @@ class Simulation:
         
         self.draw()  # Draw once at start
 
-
+        # Nothing moves, so instead of redrawing every frame, sleep until
+        # the next event arrives. If you add animation, switch back to a
+        # loop that calls self.clock.tick(self.settings.FPS).
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                pygame.display.flip()  # Show the finished drawing again
         
         pygame.quit()
 
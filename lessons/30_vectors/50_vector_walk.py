@@ -9,6 +9,7 @@ name: Vector Walk
 
 from dataclasses import dataclass
 
+import numpy as np
 import pygame
 from orbitlib.colors import Colors
 
@@ -27,6 +28,7 @@ class Settings:
     LENGTH_CHANGE: int = 5
     INITIAL_LENGTH: int = 100
     FONT_SIZE: int = 24
+    TEXT_CACHE_SIZE: int = 64  # Most rendered labels to keep
 
 
 class Player:
@@ -36,26 +38,24 @@ class Player:
         self.position = pygame.math.Vector2(x, y)
         self.direction_vector = pygame.math.Vector2(Settings.INITIAL_LENGTH, 0)
 
-        self.moves = []
+        # Positions to step through along the vector, one row per step, and
+        # the index of the next one
+        self.moves = np.empty((0, 2))
+        self.next_move = 0
+
+        # The square drawn for the player, moved to the player's position each frame
+        self.rect = pygame.Rect(0, 0, Settings.PLAYER_SIZE, Settings.PLAYER_SIZE)
 
     def update(self):
         pass  # No continuous update needed; movement is event-driven
 
     def draw(self, screen, show_line=True):
-        pygame.draw.rect(
-            screen,
-            Settings.PLAYER_COLOR,
-            (
-                self.position.x - Settings.PLAYER_SIZE // 2,
-                self.position.y - Settings.PLAYER_SIZE // 2,
-                Settings.PLAYER_SIZE,
-                Settings.PLAYER_SIZE,
-            ),
-        )
+        self.rect.center = (int(self.position.x), int(self.position.y))
+        pygame.draw.rect(screen, Settings.PLAYER_COLOR, self.rect)
 
         if show_line:
-            if self.moves:
-                end_position = self.moves[-1]
+            if self.hasMoves():
+                end_position = tuple(self.moves[-1])
             else:
                 end_position = self.position + self.direction_vector
 
@@ -63,6 +63,15 @@ class Player:
                 screen, Settings.LINE_COLOR, self.position, end_position, 2
             )
 
+    def change_length(self, d_length):
+        """Make the direction vector d_length longer, keeping its direction."""
+        length = self.direction_vector.length()
+        new_length = length + d_length
+
+        # Don't let the vector shrink to nothing; it would lose its direction
+        if new_length > 0:
+            self.direction_vector *= new_length / length
+
     def calc_moves(self):
         """Calc steps to move the player along the
         direction vector in N steps (no rendering or timing)."""
@@ -74,24 +83,20 @@ class Player:
         N = int(length // 3)
         if N == 0:
             return
-        step = (final_position - self.position) / N
-        pos = self.position.copy()
 
-        for _ in range(N):
-            pos += step
-            self.moves.append(pos.copy())
+        # N evenly spaced positions, from one step past the start to the end
+        self.moves = np.linspace(tuple(self.position), tuple(final_position), N + 1)[1:]
+        self.next_move = 0
 
     def move(self):
-        if self.moves:
-            self.position = self.moves.pop(0)
+        if self.hasMoves():
+            self.position = pygame.math.Vector2(tuple(self.moves[self.next_move]))
+            self.next_move += 1
 
-        if not self.moves:
-            return False
-        else:
-            return True
+        return self.hasMoves()
 
     def hasMoves(self):
-        return len(self.moves) > 0
+        return self.next_move < len(self.moves)
 
 
 class Simulation:
@@ -109,6 +114,10 @@ class Simulation:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, self.settings.FONT_SIZE)
 
+        # Rendered text, by string. The vector only changes when a key is
+        # pressed, so most frames draw the same labels as the frame before.
+        self.text_cache = {}
+
         self.player = Player(
             self.settings.SCREEN_WIDTH // 2, self.settings.SCREEN_HEIGHT // 2
         )
@@ -124,6 +133,20 @@ class Simulation:
 
         pygame.display.flip()
 
+    def render_text(self, text):
+        """Return a surface with text rendered on it, reusing earlier renders."""
+        surface = self.text_cache.get(text)
+
+        if surface is None:
+            if len(self.text_cache) >= self.settings.TEXT_CACHE_SIZE:
+                # Forget the oldest label
+                del self.text_cache[next(iter(self.text_cache))]
+
+            surface = self.font.render(text, True, Settings.TEXT_COLOR)
+            self.text_cache[text] = surface
+
+        return surface
+
     def draw_text(self):
         direction_x, direction_y = (
             self.player.direction_vector.x,
@@ -131,17 +154,17 @@ class Simulation:
         )
 
         vector_text = f"Vector: ({direction_x:.2f}, {direction_y:.2f})"
-        vector_surface = self.font.render(vector_text, True, Settings.TEXT_COLOR)
+        vector_surface = self.render_text(vector_text)
         self.screen.blit(vector_surface, (10, Settings.SCREEN_HEIGHT - 70))
 
         magnitude = self.player.direction_vector.length()
         magnitude_text = f"Magnitude: {magnitude:.2f}"
-        magnitude_surface = self.font.render(magnitude_text, True, Settings.TEXT_COLOR)
+        magnitude_surface = self.render_text(magnitude_text)
         self.screen.blit(magnitude_surface, (10, Settings.SCREEN_HEIGHT - 45))
 
         angle = self.player.direction_vector.angle_to(pygame.math.Vector2(1, 0))
         angle_text = f"Angle: {angle:.2f}\u00b0"
-        angle_surface = self.font.render(angle_text, True, Settings.TEXT_COLOR)
+        angle_surface = self.render_text(angle_text)
         self.screen.blit(angle_surface, (10, Settings.SCREEN_HEIGHT - 20))
 
     def run(self):
@@ -149,18 +172,26 @@ class Simulation:
         running = True
         pygame.key.set_repeat(50, 50)
 
+        # True while any key is held down. Most frames no key is down, and
+        # then there is no need to read and check the keyboard.
+        key_down = False
+
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-
-            keys = pygame.key.get_pressed()
+                elif event.type == pygame.KEYDOWN:
+                    key_down = True
+                elif event.type == pygame.KEYUP:
+                    key_down = any(pygame.key.get_pressed())
 
             if self.player.hasMoves():
                 # Move the player along the vector.
                 self.player.move()
 
-            else:
+            elif key_down:
+                keys = pygame.key.get_pressed()
+
                 if keys[pygame.K_LEFT]:
                     self.player.direction_vector = self.player.direction_vector.rotate(
                         -self.settings.ANGLE_CHANGE
@@ -171,16 +202,10 @@ class Simulation:
                     )
 
                 if keys[pygame.K_UP]:
-                    self.player.direction_vector.scale_to_length(
-                        self.player.direction_vector.length()
-                        + self.settings.LENGTH_CHANGE
-                    )
+                    self.player.change_length(self.settings.LENGTH_CHANGE)
 
                 elif keys[pygame.K_DOWN]:
-                    self.player.direction_vector.scale_to_length(
-                        self.player.direction_vector.length()
-                        - self.settings.LENGTH_CHANGE
-                    )
+                    self.player.change_length(-self.settings.LENGTH_CHANGE)
 
                 elif keys[pygame.K_SPACE]:
                     self.player.calc_moves()
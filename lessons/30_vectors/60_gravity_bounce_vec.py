@@ -27,28 +27,39 @@ class Settings:
 
 
 class Ball:
+    __slots__ = ("position", "velocity")
+
     def __init__(self, x, y):
         """Initializes the Ball with position and velocity vectors."""
         self.position = pygame.math.Vector2(x, y)
         self.velocity = pygame.math.Vector2(0, 0)
 
     def update(self):
-        self.velocity.y += Settings.GRAVITY
-        self.position += self.velocity
+        # Look the settings up once, rather than every time they are used
+        radius = Settings.BALL_RADIUS
+        elasticity = Settings.ELASTICITY
+        max_x = Settings.SCREEN_WIDTH - radius
+        max_y = Settings.SCREEN_HEIGHT - radius
+
+        position = self.position
+        velocity = self.velocity
+
+        velocity.y += Settings.GRAVITY
+        position += velocity
 
         # Bounce off the floor
-        if self.position.y + Settings.BALL_RADIUS > Settings.SCREEN_HEIGHT:
-            self.position.y = Settings.SCREEN_HEIGHT - Settings.BALL_RADIUS
-            self.velocity.y *= -Settings.ELASTICITY
+        if position.y > max_y:
+            position.y = max_y
+            velocity.y *= -elasticity
 
         # Bounce off the walls
-        if self.position.x - Settings.BALL_RADIUS < 0:
-            self.position.x = Settings.BALL_RADIUS
-            self.velocity.x *= -Settings.ELASTICITY
+        if position.x < radius:
+            position.x = radius
+            velocity.x *= -elasticity
             
-        elif self.position.x + Settings.BALL_RADIUS > Settings.SCREEN_WIDTH:
-            self.position.x = Settings.SCREEN_WIDTH - Settings.BALL_RADIUS
-            self.velocity.x *= -Settings.ELASTICITY
+        elif position.x > max_x:
+            position.x = max_x
+            velocity.x *= -elasticity
 
     def draw(self):
         pygame.draw.circle(
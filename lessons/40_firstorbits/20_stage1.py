@@ -6,18 +6,30 @@ name: Stage1
 
 import logging
 import math
-from dataclasses import dataclass
+import os
 
+import numpy as np
 import pygame
+from numba import njit
 from orbitlib.data import build_planet_data
 from orbitlib.colors import Colors
 
+try:
+    import pytreegrav  # Optional, see Settings.BH_THRESHOLD
+except ImportError:
+    pytreegrav = None
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.ERROR)
 
 pd = build_planet_data()
 
-@dataclass
+# For timing the physics only: ORBITLAB_HEADLESS=<frames> runs that many
+# frames with no window, no vsync and no frame rate cap, then exits.
+HEADLESS_FRAMES = int(os.environ.get("ORBITLAB_HEADLESS", 0))
+if HEADLESS_FRAMES:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"  # Must be set before pygame.init()
+
 class Settings:
 
     SCREEN_WIDTH: int = 1000
@@ -31,11 +43,31 @@ class Settings:
     # Force and velocity vectors. 
     FORCE_COLOR = Colors.RED
     VELOCITY_COLOR = Colors.GREEN
+    DRAW_VECTORS: bool = False  # Set to True to draw them for every planet
+    FORCE_VECTOR_SCALE: float = 2000.0  # Pixels per m/s^2 of acceleration
+    VELOCITY_VECTOR_SCALE: float = 0.001  # Pixels per m/s
 
     G: float = 6.67430e-11  # Gravitational constant (scaled for visualization)
 
+    # Softening length, added to every distance in the force calculation so
+    # that two bodies passing very close don't get a near-infinite pull, and
+    # two bodies in the same place don't divide by zero. 10,000 km is about
+    # the size of a planet, far too small to change an orbit measured in AU.
+    # 0 gives plain Newtonian gravity.
+    SOFTENING: float = 1.0e7
+
+    # With more bodies than this, forces come from a Barnes-Hut tree (the
+    # optional pytreegrav package) instead of visiting every pair, which
+    # grows as N^2. BH_THETA trades accuracy for speed; smaller is more
+    # accurate. The few bodies of the solar system always use the pair loop.
+    # Without pytreegrav (uv sync --extra tree), every system
+    # uses the pair loop.
+    BH_THRESHOLD: int = 500
+    BH_THETA: float = 0.5
+
     AU = 1.49597871e+11 # Astronomical Unit in km
     DIST_SCALE = AU / (SCREEN_WIDTH / 16) # Kilometers per pixel
+    INV_DIST_SCALE = 1 / DIST_SCALE # Pixels per kilometer
 
     FPS: int = 60 # Frames per second draw update frames/wsec
 
@@ -49,10 +81,15 @@ class Settings:
     UPDATES_PER_FRAME: int = 3
     D_T: float = SIM_SEC_PER_SEC / (FPS * UPDATES_PER_FRAME)
 
+    # The physics always steps by D_T. Each frame runs as many steps as fit
+    # in the real time the frame took, up to MAX_FRAME_TIME seconds of it, so
+    # the orbits stay the same when the frame rate drops.
+    MAX_FRAME_TIME: float = 0.25
+
     @classmethod
     def m2p(cls, meters: float|pygame.Vector2) -> float|pygame.Vector2:
         """Convert meters to pixels."""
-        return meters / cls.DIST_SCALE
+        return meters * cls.INV_DIST_SCALE
 
     @classmethod
     def p2m(cls, pixels: float|pygame.Vector2) -> float|pygame.Vector2:
@@ -60,8 +97,92 @@ class Settings:
         return pixels * cls.DIST_SCALE
 
 
+# Fast-math flags for the force kernel. Everything except "reassoc": the
+# kernel depends on the order its float32 products are evaluated in.
+FASTMATH = {"nnan", "ninf", "nsz", "arcp", "contract", "afn"}
+
+
+@njit("f4[:, :](f4[:, :], f4[:], i4[:], i4[:], f4)", fastmath=FASTMATH, cache=True)
+def compute_accel(pos: np.ndarray, gm: np.ndarray,
+                  pair_i: np.ndarray, pair_j: np.ndarray, eps2: float) -> np.ndarray:
+    """Calculate the gravitational acceleration on every body.
+
+    pos is an (N, 2) array of positions and gm an (N,) array of G * mass for
+    each body, both float32. pair_i and pair_j list every pair of bodies
+    once, with pair_i[k] < pair_j[k]. eps2 is a softening length squared,
+    added to every distance squared.
+    """
+    a = np.zeros_like(pos)
+    one = np.float32(1.0)
+
+    # Each pair is visited once. By Newton's third law the pull of j on i is
+    # equal and opposite to the pull of i on j, so both bodies are updated.
+    for k in range(pair_i.size):
+        i = pair_i[k]
+        j = pair_j[k]
+
+        dx = pos[j, 0] - pos[i, 0]
+        dy = pos[j, 1] - pos[i, 1]
+        r2 = dx * dx + dy * dy + eps2
+
+        # G m / r^2 along the unit vector (dx, dy) / r, which is G m / r^3
+        # along (dx, dy). One reciprocal square root gives 1 / r. Multiply
+        # by G m before cubing: in float32, 1 / r^3 on its own underflows
+        # at a few tens of AU.
+        inv_r = one / np.sqrt(r2)
+        s_j = gm[j] * inv_r * inv_r * inv_r
+        s_i = gm[i] * inv_r * inv_r * inv_r
+
+        a[i, 0] += s_j * dx
+        a[i, 1] += s_j * dy
+        a[j, 0] -= s_i * dx
+        a[j, 1] -= s_i * dy
+
+    return a
+
+
+@njit("void(f4[:, :], f4[:, :], f4[:, :], f4[:], i4[:], i4[:], f4, f4, i8)",
+      fastmath=FASTMATH, cache=True)
+def leapfrog(pos: np.ndarray, vel: np.ndarray, acc: np.ndarray, gm: np.ndarray,
+             pair_i: np.ndarray, pair_j: np.ndarray, eps2: float, dt: float, n: int):
+    """Advance every body by n kick-drift-kick leapfrog steps of dt.
+
+    pos, vel and acc are updated in place. acc must hold the acceleration
+    at the starting positions, and holds the acceleration at the final
+    positions when this returns. The other arguments are as for
+    compute_accel.
+    """
+    half_dt = np.float32(0.5) * dt
+    n_bodies = pos.shape[0]
+
+    # Kick: half a step of acceleration
+    kick = half_dt if n > 0 else np.float32(0.0)
+    for b in range(n_bodies):
+        vel[b, 0] += acc[b, 0] * kick
+        vel[b, 1] += acc[b, 1] * kick
+
+    for k in range(n):
+        # Drift: a full step of velocity
+        for b in range(n_bodies):
+            pos[b, 0] += vel[b, 0] * dt
+            pos[b, 1] += vel[b, 1] * dt
+
+        acc[:, :] = compute_accel(pos, gm, pair_i, pair_j, eps2)
+
+        # Kick: the other half, plus the next step's first half if there is
+        # one. Both halves use the same acceleration, so they are done together.
+        kick = dt if k < n - 1 else half_dt
+        for b in range(n_bodies):
+            vel[b, 0] += acc[b, 0] * kick
+            vel[b, 1] += acc[b, 1] * kick
+
+
 class CelestialBody:
     """Base class for all celestial bodies."""
+
+    __slots__ = ("name", "color", "radius", "mass", "settings",
+                 "idx", "pos", "vel", "acc", "sprite")
+
     def __init__(self, 
                  name: str,
                  position: tuple | pygame.Vector2, 
@@ -74,87 +195,44 @@ class CelestialBody:
         self.mass = mass
         self.settings = settings
 
-        self.pos = pygame.Vector2(position)
-        self.vel = pygame.Vector2(velocity) 
-
-    def force_due_to(self, other: "CelestialBody") -> pygame.Vector2:
-        """Calculate the gravitational force exerted by another body on this planet."""
-        # Distance squared between the two bodies
-
-        r2 = self.pos.distance_squared_to(other.pos) 
-        logger.info(f"  Distance^2 from {self.name} to {other.name}: {r2}")
-
-        if r2 == 0:
-            return pygame.Vector2(0, 0)
-       
-        # Gravitational force magnitude
-
-        logger.info(f"  masses: {self.mass * other.mass}")
-
-        f_g = (self.settings.G * self.mass * other.mass) / r2
-        logger.info(f"  Force due to {other.name}: {f_g}")
-
-        # Force vector pointing towards the other body
-        return (other.pos - self.pos).normalize() * f_g
-
-    def update_physics(self, others: list["CelestialBody"]):
-        """Advance the planet's state by one time step."""
-        
-
-        logger.info(f"Update {self.name} at pos {self.pos} vel {self.vel}")
-        # Force from the sun
-        self._force = pygame.Vector2(0,0)
-
-        for other in others:
-            if other is not self:
-                f = self.force_due_to(other)
-                
-                self._force += f
-
-        logger.info(f"Total force on {self.name}: {self._force}")
-
-        # Acceleration of the planet, from f=ma
-        a = self._force / self.mass
-        
-        # Integrate motion
-        self.vel += a * self.settings.D_T         # v = a * t + v0
-        self.pos += self.vel * self.settings.D_T  # x = v * t + x0
-
-        logger.info(f"New position {self.name} at {self.pos} v={self.vel} a={a} f={self._force}")
+        # Until the body is added to a BodySystem, it owns its own arrays. The
+        # system replaces these with views into its shared arrays.
+        self.idx = None
+        self.pos = np.array(position, dtype=np.float32)
+        self.vel = np.array(velocity, dtype=np.float32)
+        self.acc = np.zeros(2, dtype=np.float32)
 
-    def draw(self, screen: pygame.Surface):
-        """Draw the celestial body."""
-        logger.info(f"Draw {self.name} at: {self.pos} {Settings.m2p(self.pos)}")
-        pygame.draw.circle(screen, self.color, Settings.m2p(self.pos)+Settings.SCREEN_CENTER, self.radius)
+        # Draw the circle once; each frame just copies (blits) it to the screen
+        self.sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(self.sprite, color, (radius, radius), radius)
 
-    def update(self, others: list["CelestialBody"]):
-        """Stars are static in this stage; nothing to update."""
-        self.update_physics(others)
-
-
-    def circ_orbit_vel(self, other: "CelestialBody"):
+    def circ_orbit_vel(self, other: "CelestialBody") -> tuple[float, float]:
         """Calculate the circular orbital velocity needed to maintain a stable orbit."""
-        r = self.pos.distance_to(other.pos)
-
-        v =  math.sqrt(self.settings.G * other.mass / r)
+        # Vector from sun to this body, as plain floats
+        r_x = float(self.pos[0] - other.pos[0])
+        r_y = float(self.pos[1] - other.pos[1])
+        r2 = r_x * r_x + r_y * r_y
 
-        # Create a vector from sun to this body
-        r_vec = self.pos - other.pos
+        # Orbital speed is sqrt(G M / r). Dividing by r as well folds the
+        # normalization of r_vec into the same square root: sqrt(G M / r^3)
+        v_per_r = math.sqrt(self.settings.G * other.mass / (r2 * math.sqrt(r2)))
 
-        # Perpendicular direction (rotate 90 degrees counterclockwise)
-        perp = r_vec.normalize().rotate(90)
-
-        # Return velocity vector of magnitude v in perpendicular direction
-        return perp * v
+        # Velocity of magnitude v perpendicular to the radius
+        # (rotate 90 degrees counterclockwise: (x, y) -> (-y, x))
+        return (-r_y * v_per_r, r_x * v_per_r)
 
       
 
 class Star(CelestialBody):
+    __slots__ = ()
+
     def __init__(self, name: str, position: tuple | pygame.Vector2, color: tuple, radius: int, mass: int, settings: Settings):
         super().__init__(name, position, (0,0), color, radius, mass, settings)
 
 
 class Planet(CelestialBody):
+    __slots__ = ()
+
     def __init__(self, name: str, position: tuple | pygame.Vector2, 
                  velocity: tuple | pygame.Vector2, 
                  color: tuple, radius: int, mass: int, settings: Settings):
@@ -162,21 +240,118 @@ class Planet(CelestialBody):
  
         super().__init__(name, position, velocity,  color, radius, mass, settings)
 
+    def draw_vectors(self, screen: pygame.Surface):
+        """Draw the force and velocity vectors for the planet."""
+        settings = self.settings
+        start = Settings.m2p(self.pos) + Settings.SCREEN_CENTER
+        # Force vector (towards the sun). The force is mass * acceleration,
+        # so it points the same way as the last computed acceleration.
+        pygame.draw.line(screen, settings.FORCE_COLOR, start, start + self.acc * settings.FORCE_VECTOR_SCALE, 2)
+        # Velocity vector (direction of motion)
+        pygame.draw.line(screen, settings.VELOCITY_COLOR, start, start + self.vel * settings.VELOCITY_VECTOR_SCALE, 2)
 
-    def draw(self, screen: pygame.Surface):
-        """Draw the planet and its vectors."""
 
-        super().draw(screen)
+class BodySystem:
+    """Structure-of-arrays state for a group of bodies.
 
-        # Draw vectors (uses last computed force)
-        #self.draw_vectors(screen, getattr(self, "_force", pygame.Vector2(0, 0)))
+    Positions, velocities and masses for all bodies live in shared NumPy
+    arrays, so the forces between every pair can be computed at once instead
+    of one pair at a time in Python.
+    """
 
-    def draw_vectors(self, screen: pygame.Surface, force: pygame.Vector2, scale: float = 20.0):
-        """Draw the force and velocity vectors for the planet."""
-        # Force vector (towards the sun)
-        pygame.draw.line(screen, self.settings.FORCE_COLOR, Settings.m2p(self.pos), Settings.m2p(self.pos + force * scale), 2)
-        # Velocity vector (direction of motion)
-        pygame.draw.line(screen, self.settings.VELOCITY_COLOR, Settings.m2p(self.pos), Settings.m2p(self.pos + self.vel * scale), 2)
+    def __init__(self, bodies: list[CelestialBody], settings: Settings):
+        self.settings = settings
+
+        # Single precision is plenty for positions that end up as pixels, and
+        # halves the memory the force kernel reads
+        self.pos = np.array([body.pos for body in bodies], dtype=np.float32).reshape(-1, 2)
+        self.vel = np.array([body.vel for body in bodies], dtype=np.float32).reshape(-1, 2)
+        self.acc = np.zeros_like(self.pos)
+        self.mass = np.array([body.mass for body in bodies], dtype=np.float32)
+        self.radius = np.array([body.radius for body in bodies], dtype=np.int32)
+
+        # Pixel offset from a body's scaled position to the top left corner of
+        # its sprite: the screen center, less the sprite's radius
+        self.sprite_offset = np.array(Settings.SCREEN_CENTER, dtype=np.int32) - self.radius[:, None]
+
+        # G * mass, multiplied in double precision: G alone is too small to
+        # combine safely with other float32 values
+        self.gm = np.array([settings.G * body.mass for body in bodies], dtype=np.float32)
+
+        self.eps2 = np.float32(settings.SOFTENING ** 2)
+
+        self.use_tree = len(bodies) > settings.BH_THRESHOLD
+        if self.use_tree and pytreegrav is None:
+            logger.error("pytreegrav is not installed, so the forces on %d bodies "
+                         "will be computed pair by pair", len(bodies))
+            self.use_tree = False
+
+        # Every pair of bodies (i, j) with i < j, as two flat index arrays.
+        # The table grows as N^2, so it is only built for the pair loop.
+        if self.use_tree:
+            self.pair_i = np.empty(0, dtype=np.int32)
+            self.pair_j = np.empty(0, dtype=np.int32)
+        else:
+            pair_i, pair_j = np.triu_indices(len(bodies), 1)
+            self.pair_i = pair_i.astype(np.int32)
+            self.pair_j = pair_j.astype(np.int32)
+
+        # Point each body at its row of the shared arrays
+        for i, body in enumerate(bodies):
+            body.idx = i
+            body.pos = self.pos[i]
+            body.vel = self.vel[i]
+            body.acc = self.acc[i]
+
+        # Starting acceleration for the first half kick. This also compiles
+        # the kernels now, rather than stalling the first frame.
+        self.acc[:] = self.compute_accel()
+        self.step(0.0, 0)
+
+    def compute_accel(self) -> np.ndarray:
+        """Calculate the gravitational acceleration on every body."""
+        if self.use_tree:
+            return self.tree_accel()
+        return compute_accel(self.pos, self.gm, self.pair_i, self.pair_j, self.eps2)
+
+    def tree_accel(self) -> np.ndarray:
+        """Calculate the gravitational acceleration on every body with a Barnes-Hut tree."""
+        # pytreegrav works in 3D, so the bodies all sit at z = 0. Its
+        # softening is a smoothing radius per body rather than a length added
+        # to every distance, but it serves the same purpose.
+        pos3 = np.zeros((len(self.pos), 3))
+        pos3[:, :2] = self.pos
+        softening = np.full(len(self.pos), self.settings.SOFTENING)
+
+        # The masses are already multiplied by G
+        a = pytreegrav.Accel(pos3, self.gm, softening, G=1.0, theta=self.settings.BH_THETA)
+        return a[:, :2].astype(np.float32)
+
+    def sprite_pos(self) -> np.ndarray:
+        """Return the screen position of the top left corner of every sprite."""
+        # Same as m2p(pos) + SCREEN_CENTER, for all bodies in one operation
+        px = (self.pos * Settings.INV_DIST_SCALE).astype(np.int32)
+        px += self.sprite_offset
+        return px
+
+    def step(self, dt: float, n: int = 1):
+        """Advance all bodies by n time steps, using kick-drift-kick leapfrog.
+
+        All n steps run in one call to the compiled leapfrog kernel, unless
+        the system is large enough to use the Barnes-Hut tree.
+        """
+        if self.use_tree:
+            half_dt = np.float32(0.5 * dt)
+            dt = np.float32(dt)
+            for _ in range(n):
+                self.vel += self.acc * half_dt
+                self.pos += self.vel * dt
+                self.acc[:] = self.tree_accel()
+                self.vel += self.acc * half_dt
+            return
+
+        leapfrog(self.pos, self.vel, self.acc, self.gm, self.pair_i, self.pair_j,
+                 self.eps2, np.float32(dt), n)
 
 
 class Simulation:
@@ -197,53 +372,102 @@ class Simulation:
         self.clock = pygame.time.Clock()
 
         self.bodies = bodies if bodies is not None else []
+        self.build_system()
         self.running = False
 
+        # Simulated seconds the physics hasn't stepped through yet
+        self.accumulator = 0.0
+
     def add_bodies(self, bodies: list[CelestialBody]):
         """Add bodies to the simulation."""
         self.bodies.extend(bodies)
+        self.build_system()
 
     def add_body(self, body: CelestialBody):
         """Add a single body to the simulation."""
         self.bodies.append(body)
+        self.build_system()
 
-    def update(self):
-        """Update physics for all bodies."""
+    def build_system(self):
+        """Rebuild the shared body arrays and sprites after the bodies change."""
+        self.system = BodySystem(self.bodies, self.settings)
+
+        # Match the sprites' pixel format to the screen for faster blits
         for body in self.bodies:
-            body.update([other for other in self.bodies if other is not body])
+            body.sprite = body.sprite.convert_alpha()
+
+        # The sprites in body order, so draw() doesn't collect them every frame
+        self.sprites = [body.sprite for body in self.bodies]
+
+    def update(self, frame_time: float):
+        """Update physics for all bodies, for a frame that took frame_time real seconds."""
+        settings = self.settings
+        self.accumulator += min(frame_time, settings.MAX_FRAME_TIME) * settings.SIM_SEC_PER_SEC
+
+        steps = int(self.accumulator // settings.D_T)
+        if steps > 0:
+            self.system.step(settings.D_T, steps)
+            self.accumulator -= steps * settings.D_T
 
     def draw(self):
         """Draw all bodies to the screen."""
 
         self.screen.fill(self.settings.BACKGROUND_COLOR)
 
-        for body in self.bodies:
-            body.draw(self.screen)
+        # Hand all the sprites to pygame in one call
+        sprite_pos = self.system.sprite_pos().tolist()
+        self.screen.blits(zip(self.sprites, sprite_pos), doreturn=False)
+
+        if logger.isEnabledFor(logging.INFO):
+            for body in self.bodies:
+                logger.info("Draw %s at: %s %s", body.name, body.pos, Settings.m2p(body.pos))
 
+        # Draw vectors (uses last computed acceleration)
+        if self.settings.DRAW_VECTORS:
+            for body in self.bodies:
+                if isinstance(body, Planet):
+                    body.draw_vectors(self.screen)
 
-        pygame.display.flip()
+        if HEADLESS_FRAMES:
+            pygame.display.update()  # No window, so no need to wait for vsync
+        else:
+            pygame.display.flip()
 
         
     def run(self):
         """Main simulation loop with decoupled physics and rendering."""
-        from itertools import count
+        # Look these up once, instead of on every frame
+        fps = self.settings.FPS
+        frame_time = 1 / fps  # Headless runs use this for every frame
+        update = self.update
+        draw = self.draw
+        clock = self.clock
 
+        frames = 0
 
-        for i in count():
-            t = Settings.D_T* i
-
+        while True:
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return 
                 
-            for i in range(Settings.UPDATES_PER_FRAME):
-                self.update()
+            if HEADLESS_FRAMES:
+                # Do the same work every frame, so timing runs are comparable
+                update(frame_time)
+            else:
+                update(clock.get_time() / 1000)
 
-            self.draw()
+            draw()
 
-            self.clock.tick(self.settings.FPS)
+            if HEADLESS_FRAMES:
+                frames += 1
+                if frames >= HEADLESS_FRAMES:
+                    pygame.quit()
+                    return
+                clock.tick()  # Measure the frame time, but don't wait
+            else:
+                clock.tick(fps)
 
     def dump(self):
         """Use tabulate to return a string table of: planet name, mass, xy position in km, xy position in pixels
@@ -7,6 +7,7 @@ import pygame
 import math
 import rebound
 import numpy as np
+from numba import njit
 from orbitlib.colors import Colors
 
 # Initialize Pygame
@@ -46,6 +47,31 @@ TIME_SCALE = 24 * 3600  # 1 frame = 1 day in seconds
 ZOOM_FACTOR = 1.0  # Global zoom factor
 
 MAX_DISTANCE = 7.0 * AU  # Maximum distance from the central star to keep objects
+TRAIL_TIME = 90 * 24 * 3600 / 2  # Simulated seconds a trail takes to fade away
+
+
+@njit(cache=True)
+def project_and_filter(xyz, scale, center_x, center_y, width, height, max_d2,
+                       screen, keep, visible):
+    """Convert particle positions to screen coordinates and find the distant ones.
+
+    xyz is an (N, 3) array of positions, and scale is pixels per meter,
+    including the zoom. Fills three arrays, one row per particle:
+    screen, (N, 2) int32, with its screen position; keep, (N,) boolean, with
+    whether its squared distance from the origin is at most max_d2; and
+    visible, (N,) boolean, with whether it is on a width by height screen.
+    """
+    for i in range(xyz.shape[0]):
+        x = xyz[i, 0]
+        y = xyz[i, 1]
+        z = xyz[i, 2]
+        screen_x = int(x * scale + center_x)
+        screen_y = int(center_y - y * scale)  # Flip Y axis
+        screen[i, 0] = screen_x
+        screen[i, 1] = screen_y
+        keep[i] = x * x + y * y + z * z <= max_d2
+        visible[i] = 0 <= screen_x <= width and 0 <= screen_y <= height
+
 
 class CelestialBody:
     """Base class for all celestial bodies."""
@@ -54,20 +80,6 @@ class CelestialBody:
         self.color = color
         self.radius = radius
         self.name = name
-        self.trail = []  # List of (position, timestamp) tuples
-        self.max_trail_time = 90 * 24 * 3600  / 2
-
-    def add_trail_point(self, pos: tuple, timestamp: float):
-        """Add a point to the trail with timestamp and manage trail length by time."""
-        self.trail.append((pos, timestamp))
-        
-        # Remove old trail points based on time
-        cutoff_time = timestamp - self.max_trail_time
-        self.trail = [(p, t) for p, t in self.trail if t >= cutoff_time]
-    
-    def get_trail(self) -> list:
-        """Get the current trail positions only."""
-        return [pos for pos, timestamp in self.trail]
 
 class Star(CelestialBody):
     """Represents a star (fixed at origin)."""
@@ -85,70 +97,49 @@ class Planet(CelestialBody):
         self.orbital_velocity = orbital_velocity
         self.eccentricity = eccentricity
         self.inclination = inclination
-    
-    def get_initial_velocity(self, central_mass: float) -> float:
-        """Calculate initial velocity based on orbital parameters.
-        
-        Args:
-            central_mass: Mass of the central body
-            
-        Returns:
-            Initial velocity in m/s
-        """
-        if self.eccentricity == 0:
-            # Circular orbit - use provided orbital velocity
-            return self.orbital_velocity
-        else:
-            # Elliptical orbit - calculate velocity at aphelion
-            return math.sqrt(G_SI * central_mass * (1 - self.eccentricity) / 
-                           (self.orbital_distance * (1 + self.eccentricity)))
-    
-    def get_initial_state(self, central_mass: float) -> tuple:
-        """Calculate initial position and velocity based on orbital parameters.
-        
-        Args:
-            central_mass: Mass of the central body
-            
-        Returns:
-            Tuple of (x, y, z, vx, vy, vz) in SI units
-        """
-        # Calculate position based on orbital distance and eccentricity
-        if self.eccentricity == 0:
-            # Circular orbit
-            x = self.orbital_distance
-            y = 0
-            vx = 0
-            vy = self.get_initial_velocity(central_mass)
-        else:
-            # Elliptical orbit - start at aphelion for highly eccentric orbits
-            x = self.orbital_distance * (1 + self.eccentricity)
-            y = 0
-            vx = 0
-            vy = self.get_initial_velocity(central_mass)
-        
-        # Rotate the x, y position around the central body, randomly
-        angle = np.random.uniform(0, 2 * math.pi)
-        pos = pygame.Vector2(x, y)
-        rotated_pos = pos.rotate_rad(angle)
-        x, y = rotated_pos.x, rotated_pos.y
-
-        # Also rotate the velocity vector
-        vel = pygame.Vector2(vx, vy)
-        rotated_vel = vel.rotate_rad(angle)
-        vx, vy = rotated_vel.x, rotated_vel.y
-
-
-        # Add inclination if specified
-        if self.inclination != 0:
-            z = y * math.sin(self.inclination)
-            y = y * math.cos(self.inclination)
-            vz = vy * math.sin(self.inclination)
-            vy = vy * math.cos(self.inclination)
-        else:
-            z = 0
-            vz = 0
-        
-        return (x, y, z, vx, vy, vz)
+
+def initial_states_bulk(dist, ecc, incl, v_circ, central_mass: float) -> np.ndarray:
+    """Calculate initial positions and velocities for many planets at once.
+
+    Each body starts on the x axis, at aphelion for elliptical orbits, and is
+    then rotated to a random angle around the central body.
+
+    Args:
+        dist: Orbital distance of each body
+        ecc: Eccentricity of each body
+        incl: Inclination of each body, in radians
+        v_circ: Circular orbital velocity of each body, used when the eccentricity is 0
+        central_mass: Mass of the central body
+
+    Returns:
+        (N, 6) array with a row of (x, y, z, vx, vy, vz) in SI units for each body
+    """
+    dist = np.asarray(dist, dtype=float)
+    ecc = np.asarray(ecc, dtype=float)
+    incl = np.asarray(incl, dtype=float)
+    v_circ = np.asarray(v_circ, dtype=float)
+
+    # Distance and speed at aphelion. For circular orbits this is just the
+    # orbital distance and the provided orbital velocity.
+    r = dist * (1 + ecc)
+    v = np.where(ecc == 0, v_circ, np.sqrt(G_SI * central_mass * (1 - ecc) / r))
+
+    # Rotate the position (r, 0) and velocity (0, v) around the central body, randomly
+    angle = np.random.uniform(0, 2 * math.pi, dist.size)
+    cos_a = np.cos(angle)
+    sin_a = np.sin(angle)
+
+    # Tilt the orbits by their inclination. Each row is (x, y, z, vx, vy, vz).
+    cos_i = np.cos(incl)
+    sin_i = np.sin(incl)
+    return np.column_stack((
+        r * cos_a,
+        r * sin_a * cos_i,
+        r * sin_a * sin_i,
+        -v * sin_a,
+        v * cos_a * cos_i,
+        v * cos_a * sin_i,
+    ))
 
 class Asteroid(Planet):
     """Represents an asteroid - similar to Planet but not displayed in name list."""
@@ -180,11 +171,22 @@ class SolarSystemSimulation:
         # Add the central body at origin
         self.sim.add(m=self.central_body.mass, x=0, y=0, z=0, vx=0, vy=0, vz=0)
         
+        # Initial states of all the planets, calculated together
+        planets = [body for body in self.bodies[1:] if isinstance(body, Planet)]
+        states = initial_states_bulk(
+            [planet.orbital_distance for planet in planets],
+            [planet.eccentricity for planet in planets],
+            [planet.inclination for planet in planets],
+            [planet.orbital_velocity for planet in planets],
+            self.central_body.mass,
+        )
+        states = iter(states.tolist())
+
         # Add remaining bodies with their orbital parameters (skip the first body)
         for body in self.bodies[1:]:
             # Only planets have orbital parameters
             if isinstance(body, Planet):
-                x, y, z, vx, vy, vz = body.get_initial_state(self.central_body.mass)
+                x, y, z, vx, vy, vz = next(states)
 
                 self.sim.add(m=body.mass, x=x, y=y, z=z, vx=vx, vy=vy, vz=vz)
             else:
@@ -197,55 +199,175 @@ class SolarSystemSimulation:
         # Set up integration
         self.sim.integrator = "whfast"
         self.sim.dt = TIME_SCALE
+
+        # Asteroids are test particles: the star and planets pull on them,
+        # but they don't pull on anything, which saves computing the pull
+        # between every pair of asteroids. REBOUND treats the first N_active
+        # particles as the ones that pull, so this needs the asteroids last.
+        self.sim.N_active = next(
+            (i for i, body in enumerate(self.bodies) if isinstance(body, Asteroid)),
+            len(self.bodies),
+        )
         
-        # Create body properties list for visualization
-        self.body_props = []
-        
-        # Add properties for all bodies
-        for body in self.bodies:
-            self.body_props.append({
-                "color": body.color,
-                "radius": body.radius,
-                "name": body.name
-            })
+        # Drawing properties for all bodies, one array or list per property
+        self.colors = np.array([body.color for body in self.bodies], dtype=np.uint8)
+        self.radii = np.array([body.radius for body in self.bodies], dtype=np.int16)
+        self.is_asteroid = np.array([isinstance(body, Asteroid) for body in self.bodies], dtype=bool)
+
+        # Fonts are slow to load, and names never change, so load the font
+        # once and render each name once. Asteroids have no name label.
+        self.font = pygame.font.Font(None, 24)
+        self.name_surfaces = [
+            None if asteroid else self.font.render(body.name, True, WHITE)
+            for body, asteroid in zip(self.bodies, self.is_asteroid.tolist())
+        ]
+
+        # Asteroids are drawn all together in one blits() call, each from a
+        # circle drawn once here. The other bodies are drawn one at a time,
+        # with their velocity vectors and names.
+        self.asteroid_sprites = [
+            self.make_sprite(body) if asteroid else None
+            for body, asteroid in zip(self.bodies, self.is_asteroid.tolist())
+        ]
+
+        # Buffers for all particle positions and velocities, filled by
+        # REBOUND in one call, and for their screen positions. Particles are
+        # only ever removed, so these never need to grow.
+        self.xyz = np.empty((self.sim.N, 3))
+        self.vxyz = np.empty((self.sim.N, 3))
+        self.screen_xy = np.empty((self.sim.N, 2), dtype=np.int32)
+        self.keep = np.empty(self.sim.N, dtype=bool)
+        self.visible = np.empty(self.sim.N, dtype=bool)
+
+        # Trails are drawn onto their own transparent surface, which is kept
+        # from frame to frame. Each step adds the newest segment of every
+        # trail and fades the whole surface a little, so old segments fade
+        # away without being redrawn. prev_screen_xy holds each particle's
+        # screen position at the last step, and trail_fade the fading that
+        # is too small to apply yet.
+        self.trail_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.prev_screen_xy = None
+
+        # What the last call to project() returned, and the simulation time
+        # and zoom it was called with
+        self.projection = None
+        self.projected_at = None
+        self.trail_fade = 0.0
         
-    def screen_pos(self, x, y):
-        """Convert simulation coordinates to screen coordinates"""
-        screen_x = int(x * SCALE * ZOOM_FACTOR + SCREEN_WIDTH // 2)
-        screen_y = int(-y * SCALE * ZOOM_FACTOR + SCREEN_HEIGHT // 2)  # Flip Y axis
-        return (screen_x, screen_y)
+    @staticmethod
+    def make_sprite(body: CelestialBody) -> pygame.Surface:
+        """Draw a body's circle once, on a surface that can be copied to the screen.
+
+        The circle is centered on the surface at (body.radius + 1, body.radius + 1).
+        """
+        size = 2 * body.radius + 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, body.color, (body.radius + 1, body.radius + 1), body.radius)
+        return sprite.convert_alpha()
+
+    def project(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find every particle's screen position, and which particles to keep and to draw.
+
+        Also copies every particle's position and velocity into self.xyz and
+        self.vxyz.
+
+        Returns:
+            (N, 2) int32 array of screen positions, (N,) boolean array that
+            is False for particles beyond MAX_DISTANCE, and (N,) boolean
+            array that is True for particles on the screen. All three are
+            views of buffers that the next call overwrites.
+        """
+        n = self.sim.N
+        xyz = self.xyz[:n]
+        screen = self.screen_xy[:n]
+        keep = self.keep[:n]
+        visible = self.visible[:n]
+
+        self.sim.serialize_particle_data(xyz=xyz, vxvyvz=self.vxyz[:n])
+
+        # ZOOM_FACTOR changes with the keyboard, so the scale is worked out
+        # here, once per call, rather than once per particle
+        project_and_filter(xyz, SCALE * ZOOM_FACTOR, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                           SCREEN_WIDTH, SCREEN_HEIGHT, MAX_DISTANCE**2, screen, keep, visible)
+
+        self.projected_at = (self.sim.t, ZOOM_FACTOR)
+        self.projection = (screen, keep, visible)
+        return self.projection
+
+    def current_projection(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the results of project(), calling it again only if the
+        simulation time or the zoom has changed since the last call."""
+        if self.projected_at != (self.sim.t, ZOOM_FACTOR):
+            return self.project()
+        return self.projection
     
     def update_simulation(self):
         """Advance the simulation by one time step"""
         self.sim.integrate(self.sim.t + self.sim.dt)
         
         # Remove objects that are more than 5 AU from the star
-        self.remove_distant_objects()
+        screen_xy = self.remove_distant_objects()
         
-        # Update trails with current simulation time
-        for i, particle in enumerate(self.sim.particles):
-            pos = self.screen_pos(particle.x, particle.y)
-            if i < len(self.bodies):
-                self.bodies[i].add_trail_point(pos, self.sim.t)
+        self.update_trails(screen_xy)
+
+    def update_trails(self, screen_xy: np.ndarray):
+        """Fade the trails by one time step and add each particle's newest segment.
+
+        Args:
+            screen_xy: (N, 2) array of every particle's current screen position
+        """
+        # A trail fades from fully opaque to clear in TRAIL_TIME. Alpha is
+        # a whole number, so carry any fraction over to the next step.
+        self.trail_fade += 255 * self.sim.dt / TRAIL_TIME
+        fade = min(int(self.trail_fade), 255)
+        if fade > 0:
+            # Subtract from the alpha channel, stopping at zero. This is
+            # several times faster than a fill with BLEND_RGBA_SUB.
+            alpha = pygame.surfarray.pixels_alpha(self.trail_surface)
+            np.maximum(alpha, fade, out=alpha)
+            alpha -= fade
+            del alpha  # Unlock the surface
+            self.trail_fade -= fade
+
+        if self.prev_screen_xy is not None:
+            colors = self.colors.tolist()
+            for color, start, end in zip(colors, self.prev_screen_xy.tolist(), screen_xy.tolist()):
+                pygame.draw.line(self.trail_surface, color, start, end, 1)
+        self.prev_screen_xy = screen_xy.copy()
     
-    def remove_distant_objects(self):
-        """Remove objects that are more than 5 AU from the central star"""
-        
+    def remove_distant_objects(self) -> np.ndarray:
+        """Remove objects that are more than 5 AU from the central star
+
+        Returns:
+            (N, 2) int32 array of the remaining particles' screen positions
+        """
+        screen, keep, visible = self.project()
+        distant = np.flatnonzero(~keep[1:]) + 1  # Skip index 0 (central star)
         
-        # Check particles in reverse order to avoid index issues when removing
-        for i in range(len(self.sim.particles) - 1, 0, -1):  # Skip index 0 (central star)
-            particle = self.sim.particles[i]
-            distance = math.sqrt(particle.x**2 + particle.y**2 + particle.z**2)
+        # Remove in reverse order to avoid index issues when removing
+        for i in distant[::-1].tolist():
+            # Remove from simulation
+            self.sim.remove(i)
             
-            if distance > MAX_DISTANCE:
-                # Remove from simulation
-                self.sim.remove(i)
-                
-                # Remove corresponding entries from our tracking lists
-                if i < len(self.bodies):
-                    self.bodies.pop(i)
-                if i < len(self.body_props):
-                    self.body_props.pop(i)
+            # Remove corresponding entries from our tracking lists
+            if i < len(self.bodies):
+                self.bodies.pop(i)
+            if i < len(self.name_surfaces):
+                self.name_surfaces.pop(i)
+            if i < len(self.asteroid_sprites):
+                self.asteroid_sprites.pop(i)
+
+        if distant.size:
+            self.colors = np.delete(self.colors, distant, axis=0)
+            self.radii = np.delete(self.radii, distant)
+            self.is_asteroid = np.delete(self.is_asteroid, distant)
+            if self.prev_screen_xy is not None:
+                self.prev_screen_xy = np.delete(self.prev_screen_xy, distant, axis=0)
+
+            # The particles have moved up in the buffers to fill the gaps
+            screen, keep, visible = self.project()
+
+        return screen
 
     
     def draw(self, screen):
@@ -254,60 +376,69 @@ class SolarSystemSimulation:
         screen.fill(BLACK)
         
         # Draw trails
-        for i, body in enumerate(self.bodies):
-            if i < len(self.sim.particles):
-                trail = body.get_trail()
-                if len(trail) > 1:
-                    # Draw trail with fading effect
-                    for j in range(1, len(trail)):
-                        alpha = j / len(trail)
-                        color = tuple(int(c * alpha) for c in body.color)
-                        if j < len(trail) - 1:
-                            pygame.draw.line(screen, color, trail[j-1], trail[j], 1)
+        screen.blit(self.trail_surface, (0, 0))
         
-        # Draw bodies
-        for i, particle in enumerate(self.sim.particles):
-            pos = self.screen_pos(particle.x, particle.y)
+        # Draw bodies. Only draw if on screen: project() finds those
+        # bodies all at once, so the loop below skips the rest without
+        # testing each one.
+        screen_xy, keep, on_screen = self.current_projection()
+
+        screen_positions = screen_xy.tolist()
+        colors = self.colors.tolist()
+        radii = self.radii.tolist()
+        is_asteroid = self.is_asteroid.tolist()
+        velocities = self.vxyz[:len(screen_positions)].tolist()
+        asteroid_blits = []
+        for i in np.flatnonzero(on_screen).tolist():
+            pos = screen_positions[i]
+
+            # Asteroids are drawn as dots, with no velocity vector or name.
+            # Collect them to draw together after the loop.
+            if is_asteroid[i]:
+                offset = radii[i] + 1
+                asteroid_blits.append((self.asteroid_sprites[i], (pos[0] - offset, pos[1] - offset)))
+                continue
+
+            pygame.draw.circle(screen, colors[i], pos, radii[i])
             
-            # Only draw if on screen
-            if 0 <= pos[0] <= SCREEN_WIDTH and 0 <= pos[1] <= SCREEN_HEIGHT:
-                pygame.draw.circle(screen, self.body_props[i]["color"], pos, self.body_props[i]["radius"])
-                
-                # Draw velocity vector (scaled for visibility)
-                vel_scale = 1e-4  # Scale factor for velocity vectors
-                vel_end = (
-                    int(pos[0] + particle.vx * vel_scale),
-                    int(pos[1] - particle.vy * vel_scale)  # Flip Y axis
-                )
-                pygame.draw.line(screen, GREEN, pos, vel_end, 2)
-                
-                # Draw name only if not an asteroid
-                if not isinstance(self.bodies[i], Asteroid):
-                    font = pygame.font.Font(None, 24)
-                    text = font.render(self.body_props[i]["name"], True, WHITE)
-                    text_rect = text.get_rect(center=(pos[0], pos[1] - self.body_props[i]["radius"] - 15))
-                    screen.blit(text, text_rect)
+            # Draw velocity vector (scaled for visibility)
+            v_x, v_y, v_z = velocities[i]
+            vel_scale = 1e-4  # Scale factor for velocity vectors
+            vel_end = (
+                int(pos[0] + v_x * vel_scale),
+                int(pos[1] - v_y * vel_scale)  # Flip Y axis
+            )
+            pygame.draw.line(screen, GREEN, pos, vel_end, 2)
+            
+            # Draw name
+            text = self.name_surfaces[i]
+            text_rect = text.get_rect(center=(pos[0], pos[1] - radii[i] - 15))
+            screen.blit(text, text_rect)
+
+        screen.blits(asteroid_blits, doreturn=False)
         
         # Draw simulation info
         self.draw_info(screen)
     
     def draw_info(self, screen):
-        """Draw simulation information on screen"""
-        font = pygame.font.Font(None, 24)
+        """Draw simulation information on screen
+
+        Uses the particle positions and velocities from the last call to project().
+        """
+        font = self.font
         
         info_lines = [f"Time: {self.sim.t / (24 * 3600):.1f} days"]
         
-        # Show information for each orbiting body
-        for i, body in enumerate(self.bodies[1:]):  # Skip the central body
-            particle_index = i + 1  # Skip the central body (index 0)
-            if isinstance(body, Asteroid):
-                continue
-            if particle_index < len(self.sim.particles):
-                particle = self.sim.particles[particle_index]
-                distance = math.sqrt(particle.x**2 + particle.y**2)
-                speed = math.sqrt(particle.vx**2 + particle.vy**2)
-                
-                info_lines.append(f"{body.name}: {distance / AU:.3f} AU, {speed / 1000:.1f} km/s")
+        # Show information for each orbiting body, other than asteroids
+        planet_indices = np.flatnonzero(~self.is_asteroid[1:]) + 1  # Skip the central body (index 0)
+        xyz = self.xyz[planet_indices]
+        vxyz = self.vxyz[planet_indices]
+        distances = np.hypot(xyz[:, 0], xyz[:, 1])
+        speeds = np.hypot(vxyz[:, 0], vxyz[:, 1])
+
+        for particle_index, distance, speed in zip(planet_indices.tolist(), distances.tolist(), speeds.tolist()):
+            body = self.bodies[particle_index]
+            info_lines.append(f"{body.name}: {distance / AU:.3f} AU, {speed / 1000:.1f} km/s")
         
         for i, line in enumerate(info_lines):
             text = font.render(line, True, WHITE)
@@ -374,19 +505,24 @@ def create_demo_system():
     )
 
 
-    asteroids = []
-    for i in range(40):
-        # Random orbital properties
-        distance = np.random.uniform(.7, 7.0) * AU  # Between 1.1 and 7.0 AU (asteroid belt)
-        ecc =np.random.uniform(0.0, 0.9)  
-        inclination = 0 # np.random.uniform(0.0, 0.3)  # Inclination up to 0.3 radians (~17 degrees)
-        
-        # Random physical properties
-        size = 2 # np.random.uniform(1, 4)  # Visual si`ze between 1-3 pixels
-        mass = np.random.uniform(1e8, 1e17)  # Mass between 10^9 and 10^17 kg
+    # Random orbital properties, drawn for all the asteroids at once
+    n_asteroids = 40
+    distances = np.random.uniform(.7, 7.0, n_asteroids) * AU  # Between 1.1 and 7.0 AU (asteroid belt)
+    eccentricities = np.random.uniform(0.0, 0.9, n_asteroids)
+    inclination = 0 # np.random.uniform(0.0, 0.3)  # Inclination up to 0.3 radians (~17 degrees)
+    orbital_velocities = np.sqrt(G_SI * M_SUN / distances)
+
+    # Random physical properties
+    size = 2 # np.random.uniform(1, 4)  # Visual si`ze between 1-3 pixels
+    mass = 0.0 # np.random.uniform(1e8, 1e17)  # Massless test particles, see SolarSystemSimulation
+
+    # Random color variation (shades of gray to white)
+    gray_shades = np.random.randint(150, 255, n_asteroids)
 
-        # Random color variation (shades of gray to white)
-        gray_shade = np.random.randint(150, 255)
+    asteroids = []
+    for i, (distance, ecc, orbital_velocity, gray_shade) in enumerate(zip(
+            distances.tolist(), eccentricities.tolist(), orbital_velocities.tolist(),
+            gray_shades.tolist())):
         color = (gray_shade, gray_shade, gray_shade)
         
         # Create the asteroid
@@ -396,7 +532,7 @@ def create_demo_system():
             radius=int(size),
             name=f"Asteroid {i+1}",
             orbital_distance=distance,
-            orbital_velocity=math.sqrt(G_SI * M_SUN / distance),
+            orbital_velocity=orbital_velocity,
             eccentricity=ecc,
             inclination=inclination
         )
@@ -417,6 +553,17 @@ clock = pygame.time.Clock()
 paused = False
 time_multiplier = 1.0
 
+# Load the font and render the list of controls once, since they never change
+font = pygame.font.Font(None, 20)
+controls = [
+    "Controls:",
+    "SPACE - Reset",
+    "P - Pause/Unpause",
+    "+/- - Speed up/slow time",
+    "Z/X - Zoom in/out"
+]
+control_texts = [font.render(control, True, WHITE) for control in controls]
+
 while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -450,17 +597,7 @@ while running:
     simulation.draw(screen)
     
     # Draw controls info
-    font = pygame.font.Font(None, 20)
-    controls = [
-        "Controls:",
-        "SPACE - Reset",
-        "P - Pause/Unpause",
-        "+/- - Speed up/slow time",
-        "Z/X - Zoom in/out"
-    ]
-    
-    for i, control in enumerate(controls):
-        text = font.render(control, True, WHITE)
+    for i, text in enumerate(control_texts):
         screen.blit(text, (SCREEN_WIDTH - 200, 10 + i * 20))
     
     # Show time multiplier and zoom
@@ -0,0 +1,188 @@
+"""
+bodypool.py
+
+Structure-of-arrays storage for many bodies moving under simple forces.
+
+The lesson programs give each Body its own x, y, v_x and v_y attributes and
+update them one at a time. A BodyPool instead keeps the positions, velocities
+and accelerations of all of its bodies in NumPy arrays, so a single expression
+updates every body at once. This matters once a scene has hundreds or
+thousands of bodies.
+"""
+
+import numpy as np
+import pygame
+
+from orbitlib.physics_kernels import step_pool
+
+# Every array in a pool uses single precision. That is plenty for positions
+# measured in pixels, and it halves the memory each frame has to touch.
+DTYPE = np.float32
+
+
+class BodyPool:
+    """
+    A group of bodies whose state is stored in NumPy arrays.
+
+    Row i of each array belongs to body i. Positions are the top left corner
+    of the square drawn for each body, in pixels.
+
+    Attributes:
+        pos (np.ndarray): (N, 2) positions, in pixels.
+        vel (np.ndarray): (N, 2) velocities, in pixels per second.
+        acc (np.ndarray): (N, 2) accelerations, in pixels per second squared.
+        mass (np.ndarray): (N,) masses.
+        size (int): Side length of the square drawn for each body, in pixels.
+        color (tuple): Color used to draw the bodies.
+        sprite (pygame.Surface): The square drawn for each body.
+    """
+
+    def __init__(self, n, size=10, color=(255, 255, 255), mass=1.0):
+        """
+        Create a pool of n bodies, all at rest at the origin.
+
+        Args:
+            n (int): Number of bodies.
+            size (int): Side length of the square drawn for each body, in pixels.
+            color (tuple): Color used to draw the bodies.
+            mass (float): Mass given to every body.
+        """
+        self.pos = np.zeros((n, 2), dtype=DTYPE)
+        self.vel = np.zeros((n, 2), dtype=DTYPE)
+        self.acc = np.zeros((n, 2), dtype=DTYPE)
+        self.mass = np.full(n, mass, dtype=DTYPE)
+
+        # Scratch space, allocated once so that update() and the collision
+        # checks don't create new arrays every frame
+        self._tmp = np.empty_like(self.vel)
+        self._hit = np.empty(n, dtype=bool)
+        self._hit2 = np.empty(n, dtype=bool)
+
+        self.size = size
+        self.color = color
+
+        # Every body looks the same, so they can all share one sprite. It is
+        # converted to the screen's pixel format the first time it is drawn.
+        self.sprite = pygame.Surface((size, size))
+        self.sprite.fill(color)
+        self._sprite_converted = False
+
+    def __len__(self):
+        return len(self.pos)
+
+    def apply_gravity(self, gravity):
+        """
+        Set the acceleration of every body to gravity, pointing down the screen.
+
+        Args:
+            gravity (float): Acceleration due to gravity, in pixels per second squared.
+        """
+        self.acc[:, 1] = gravity
+
+    def update(self, d_t):
+        """
+        Advance every body by one time step, then clear the accelerations.
+
+        Args:
+            d_t (float): Time step, in seconds.
+        """
+        # A float64 time step would make NumPy do the math in double precision
+        d_t = DTYPE(d_t)
+
+        np.multiply(self.acc, d_t, out=self._tmp)
+        self.vel += self._tmp
+
+        np.multiply(self.vel, d_t, out=self._tmp)
+        self.pos += self._tmp
+
+        # Forces need to be applied again each frame
+        self.acc.fill(0.0)
+
+    def check_wall_collision(self, width, elasticity=1.0):
+        """
+        Bounce bodies off the left and right edges of the screen.
+
+        Bodies past an edge are moved back onto the screen and their x
+        velocity is reversed. This is done for all bodies at once, with no
+        per-body if statements.
+
+        Args:
+            width (int): Width of the screen, in pixels.
+            elasticity (float): Fraction of the speed kept after a bounce.
+
+        Returns:
+            np.ndarray: (N,) boolean array, True for the bodies that hit a wall.
+            The array is reused by the next collision check, so copy it if you
+            need to keep it.
+        """
+        x = self.pos[:, 0]
+        v_x = self.vel[:, 0]
+        max_x = width - self.size
+
+        hit = np.less(x, 0, out=self._hit)
+        np.logical_or(hit, np.greater(x, max_x, out=self._hit2), out=hit)
+        np.multiply(v_x, DTYPE(-elasticity), out=v_x, where=hit)
+        np.clip(x, 0, max_x, out=x)
+
+        return hit
+
+    def check_ground_collision(self, height, elasticity=1.0):
+        """
+        Bounce bodies off the bottom of the screen.
+
+        Args:
+            height (int): Height of the screen, in pixels.
+            elasticity (float): Fraction of the speed kept after a bounce.
+
+        Returns:
+            np.ndarray: (N,) boolean array, True for the bodies that hit the ground.
+            The array is reused by the next collision check, so copy it if you
+            need to keep it.
+        """
+        y = self.pos[:, 1]
+        v_y = self.vel[:, 1]
+        max_y = height - self.size
+
+        hit = np.greater(y, max_y, out=self._hit)
+        np.multiply(v_y, DTYPE(-elasticity), out=v_y, where=hit)
+        np.minimum(y, max_y, out=y)
+
+        return hit
+
+    def step(self, gravity, width, height, d_t, elasticity=1.0):
+        """
+        Apply gravity, move every body, and bounce off the walls and ground.
+
+        This gives the same result as calling apply_gravity(), update(),
+        check_wall_collision() and check_ground_collision() in turn, but does
+        it all in one compiled loop. Use it when gravity is the only force.
+
+        Args:
+            gravity (float): Acceleration due to gravity, in pixels per second squared.
+            width (int): Width of the screen, in pixels.
+            height (int): Height of the screen, in pixels.
+            d_t (float): Time step, in seconds.
+            elasticity (float): Fraction of the speed kept after a bounce.
+        """
+        step_pool(self.pos, self.vel, DTYPE(gravity), DTYPE(width), DTYPE(height),
+                  DTYPE(self.size), DTYPE(d_t), DTYPE(elasticity))
+
+    def draw(self, screen):
+        """
+        Draw every body as a square.
+
+        All of the squares are drawn with a single call to screen.blits(),
+        instead of one pygame call per body.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+        """
+        if not self._sprite_converted:
+            self.sprite = self.sprite.convert(screen)
+            self._sprite_converted = True
+
+        sprite = self.sprite
+        screen.blits(
+            [(sprite, xy) for xy in self.pos.astype(np.int32).tolist()],
+            doreturn=False,
+        )
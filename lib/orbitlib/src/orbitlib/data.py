@@ -3,8 +3,11 @@ Planetary data classes and functions for orbital simulation.
 """
 
 # Get planetary data from Skyfield and create PlanetData objects
+import warnings
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterator, List, Tuple
+
+import numpy as np
 from skyfield.api import load
 from skyfield.framelib import ecliptic_frame
 
@@ -18,6 +21,54 @@ class PlanetData:
     vel3: Tuple[float, float, float]  # (v_x, v_y, v_z) velocities in m/s
     mass: float  # Mass in kg
 
+@dataclass
+class PlanetSystem:
+    """Positions, velocities and masses of a group of planets, stored in arrays.
+
+    Row i of each array belongs to the planet names[i]. The system also
+    works like the dictionary of PlanetData objects that build_planet_data()
+    used to return: system['earth'] returns a PlanetData for the Earth, and
+    iterating goes over the names.
+    """
+    names: List[str]
+    pos: np.ndarray  # (N, 3) coordinates in meters
+    vel: np.ndarray  # (N, 3) velocities in m/s
+    mass: np.ndarray  # (N,) masses in kg
+
+    def __post_init__(self):
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def keys(self) -> List[str]:
+        return list(self.names)
+
+    def values(self) -> List[PlanetData]:
+        return [self[name] for name in self.names]
+
+    def items(self) -> List[Tuple[str, PlanetData]]:
+        return [(name, self[name]) for name in self.names]
+
+    def __getitem__(self, name: str) -> PlanetData:
+        i = self.index[name]
+        x, y, z = self.pos[i].tolist()
+        v_x, v_y, v_z = self.vel[i].tolist()
+        return PlanetData(
+            name=name,
+            pos2=(x, y),
+            vel2=(v_x, v_y),
+            pos3=(x, y, z),
+            vel3=(v_x, v_y, v_z),
+            mass=float(self.mass[i]),
+        )
+
 # Hardcoded planetary masses in kg
 planetary_masses = {
     'mercury': 3.301e23,
@@ -28,58 +79,70 @@ planetary_masses = {
     'sun': 1.989e30
 }
 
-# Suppress the nutation warnings from Skyfield
-import warnings
-warnings.filterwarnings("ignore", category=RuntimeWarning, module="skyfield.nutationlib")
+# Meters in one astronomical unit (1 AU = 149,597,870.7 km)
+AU_TO_M = 1.495978707e11
+KM_TO_M = 1000
+
+# The ephemeris and timescale are slow to load, so load them the first time
+# they are needed and reuse them after that
+_EPH = None
+_TS = None
+
+def _get_eph():
+    """Return the JPL ephemeris and the Skyfield timescale, loading them once."""
+    global _EPH, _TS
+    if _EPH is None:
+        _EPH = load('de421.bsp')
+        _TS = load.timescale()
+    return _EPH, _TS
 
 def build_planet_data():
-    """Build and return a dictionary of PlanetData objects 
-    with data about the position, velocity and mass for the planets."""
+    """Build and return a PlanetSystem with the position, velocity and mass
+    of the Sun and the planets, in meters, m/s and kg."""
 
-    # Load JPL ephemeris and get planet objects
-    planets = load('de421.bsp')
+    # Get the JPL ephemeris and the timescale
+    planets, ts = _get_eph()
 
     names = ['sun', 'mercury', 'venus', 'earth', 'mars', 'jupiter barycenter']
 
     sun = planets['sun']
 
-    # Get current time
-    ts = load.timescale()
-    t = ts.now()
-
-    # Create PlanetData objects directly
-    planet_data = {}
-
-    for name in names:
-        # Get position relative to Sun in ecliptic coordinates
-        pos = sun.at(t).observe(planets[name])
-        x, y, z = pos.frame_xyz(ecliptic_frame).au
-        
-        # Convert AU to km (1 AU = 149,597,870.7 km), then km to meters
-        au_to_km = 149597870.7
-        km_to_m = 1000
-        x_m = x * au_to_km * km_to_m
-        y_m = y * au_to_km * km_to_m
-        z_m = z * au_to_km * km_to_m
-        
-        # Get velocity components and convert km/s to m/s
-        planet_at_t = planets[name].at(t)
-        vx, vy, vz = planet_at_t.velocity.km_per_s
-        vx_m = vx * km_to_m
-        vy_m = vy * km_to_m
-        vz_m = vz * km_to_m
-        
-        # Create PlanetData object (convert numpy values to Python floats)
-
-        pname = (name.split(' ', 1)[0])
-
-        planet_data[pname] = PlanetData(
-            name=pname,
-            pos2=(float(x_m), float(y_m)),
-            vel2=(float(vx_m), float(vy_m)),
-            pos3=(float(x_m), float(y_m), float(z_m)),
-            vel3=(float(vx_m), float(vy_m), float(vz_m)),
-            mass=float(planetary_masses[name])
-        )
+    pos = np.empty((len(names), 3))
+    vel = np.empty((len(names), 3))
+    mass = np.empty(len(names))
+
+    # Suppress the nutation warnings from Skyfield, only while it is working
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning, module="skyfield.nutationlib")
+
+        # Get current time
+        t = ts.now()
+
+        # The Sun's position and the rotation into ecliptic coordinates only
+        # need to be computed once for all the planets
+        sun_at = sun.at(t)
+        to_ecliptic = ecliptic_frame.rotation_at(t)
+
+        for i, name in enumerate(names):
+            # One ephemeris lookup gives both the position and the velocity
+            planet_at = planets[name].at(t)
+
+            # Get position relative to Sun, in AU. This is where the planet
+            # is at time t, not where it appears to be from the Sun after
+            # light travel time, which is what the simulation needs.
+            pos[i] = planet_at.position.au - sun_at.position.au
+
+            # Get velocity components and convert km/s to m/s
+            vel[i] = planet_at.velocity.km_per_s * KM_TO_M
+
+            mass[i] = planetary_masses[name]
+
+    # Rotate the positions into ecliptic coordinates and convert AU to meters
+    pos = pos @ to_ecliptic.T * AU_TO_M
 
-    return planet_data
+    return PlanetSystem(
+        names=[name.split(' ', 1)[0] for name in names],
+        pos=pos,
+        vel=vel,
+        mass=mass,
+    )
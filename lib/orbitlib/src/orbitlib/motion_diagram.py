@@ -1,7 +1,18 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-def motion_diagram_tl(n_points=6, x0=0, v0=10, a=1.0, dt=1):
+def _kinematics(n_points, x0, v0, a, dt):
+    """
+    Return the times, positions and velocities of an object with constant
+    acceleration, at n_points times dt apart.
+    """
+    times = np.arange(n_points) * dt
+    positions = x0 + v0 * times + 0.5 * a * times**2
+    velocities = v0 + a * times
+    return times, positions, velocities
+
+def motion_diagram_tl(n_points=6, x0=0, v0=10, a=1.0, dt=1,
+                      times=None, positions=None, velocities=None):
     """
     Draw a motion diagram for an object with constant acceleration.
     Args:
@@ -10,10 +21,15 @@ def motion_diagram_tl(n_points=6, x0=0, v0=10, a=1.0, dt=1):
         v0 (float): Initial velocity (m/s)
         a (float): Acceleration (m/s^2)
         dt (float): Time step (s)
+        times, positions, velocities (np.ndarray): Optional arrays from
+            _kinematics(), used instead of computing them again. Pass all
+            three or none of them.
     """
-    times = np.arange(n_points) * dt
-    positions = x0 + v0 * times + 0.5 * a * times**2
-    velocities = v0 + a * times
+    if times is None and positions is None and velocities is None:
+        times, positions, velocities = _kinematics(n_points, x0, v0, a, dt)
+    elif times is None or positions is None or velocities is None:
+        raise ValueError("pass all of times, positions and velocities, or none of them")
+    n_points = len(times)
 
     # Move the timeline lower
     y_timeline = -0.15
@@ -24,66 +40,86 @@ def motion_diagram_tl(n_points=6, x0=0, v0=10, a=1.0, dt=1):
     # Draw points
     ax.plot(positions, y, 'ko', markersize=10)
 
-    # Draw arrows (displacement vectors) from dot to dot, with increasing length
-    for i in range(n_points - 1):
-        dx = positions[i+1] - positions[i]
-        # Average velocity for the interval
-        v1 = velocities[i]
-        v2 = velocities[i+1]
-        v_avg = 0.5 * (v1 + v2)
-        ax.arrow(positions[i], y[i], dx, 0, head_width=0.08, head_length=0.18, fc='royalblue', ec='royalblue', length_includes_head=True)
-        # Raise Δx and velocity labels
-        ax.text(positions[i] + dx/2, y_timeline + 0.22, fr"$\Delta x = {dx:.2f}\,\mathrm{{m}}$", color='royalblue', fontsize=9, ha='center')
-        ax.text(positions[i] + dx/2, y_timeline + 0.12, fr"$v_{{avg}} = {v_avg:.2f}\,\mathrm{{m/s}}$", color='green', fontsize=9, ha='center')
+    # Draw arrows (displacement vectors) from dot to dot, with increasing
+    # length. One quiver call draws them all, which is much faster than one
+    # ax.arrow per interval when there are many points.
+    dx = np.diff(positions)
+    # Average velocity for each interval
+    v_avg = 0.5 * (velocities[:-1] + velocities[1:])
+    ax.quiver(positions[:-1], y[:-1], dx, np.zeros(n_points - 1),
+              angles='xy', scale_units='xy', scale=1, color='royalblue',
+              width=0.002, headwidth=6, headlength=6, headaxislength=5)
+
+    # Build all of the label strings first, so the loops below only create
+    # the Text artists
+    dx_labels = [fr"$\Delta x = {d:.2f}\,\mathrm{{m}}$" for d in dx]
+    v_avg_labels = [fr"$v_{{avg}} = {v:.2f}\,\mathrm{{m/s}}$" for v in v_avg]
+    time_labels = [f"$t={int(t)}$" for t in times]
+    v_labels = [fr"$v = {v:.2f}\,\mathrm{{m/s}}$" for v in velocities]
+
+    # Raise Δx and velocity labels
+    for x_mid, dx_label, v_avg_label in zip(positions[:-1] + dx/2, dx_labels, v_avg_labels):
+        ax.text(x_mid, y_timeline + 0.22, dx_label, color='royalblue', fontsize=9, ha='center')
+        ax.text(x_mid, y_timeline + 0.12, v_avg_label, color='green', fontsize=9, ha='center')
 
     # Time labels (t=0, t=1, t=2, ...), lower than timeline
     ax.set_ylim(-0.7, 0.3)
-    time_labels = [f"$t={int(t)}$" for t in times]
-    for i in range(n_points):
-        ax.text(positions[i], y_timeline - 0.22, time_labels[i], fontsize=12, ha='center')
+    for x, time_label, v_label in zip(positions, time_labels, v_labels):
+        ax.text(x, y_timeline - 0.22, time_label, fontsize=12, ha='center')
         # Velocity at each time t, below the time label
-        ax.text(positions[i], y_timeline - 0.35, fr"$v = {velocities[i]:.2f}\,\mathrm{{m/s}}$", color='green', fontsize=9, ha='center')
+        ax.text(x, y_timeline - 0.35, v_label, color='green', fontsize=9, ha='center')
 
     ax.axis('off')
     plt.title("Motion Diagram")
     plt.tight_layout()
     plt.show()
 
-def motion_diagram_lcx(n_points=6, x0=0, v0=10, a=1.0, dt=1):
+def motion_diagram_lcx(n_points=6, x0=0, v0=10, a=1.0, dt=1,
+                       times=None, positions=None):
     """
     Plot x (position) vs time for an object with constant acceleration.
+    Pass both times and positions from _kinematics(), or neither.
     """
-    times = np.arange(n_points) * dt
-    positions = x0 + v0 * times + 0.5 * a * times**2
-    plt.figure(figsize=(6, 3))
-    plt.plot(times, positions, 'o-', color='royalblue')
-    for t, x in zip(times, positions):
-        plt.text(t, x + 4, f"{x:.2f}", ha='center', fontsize=9, color='royalblue')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Position x (m)')
-    plt.title('Position vs Time')
-    plt.grid(True, linestyle=':')
-    plt.tight_layout()
+    if times is None and positions is None:
+        times, positions, _ = _kinematics(n_points, x0, v0, a, dt)
+    elif times is None or positions is None:
+        raise ValueError("pass both times and positions, or neither")
+    fig, ax = plt.subplots(figsize=(6, 3))
+    ax.plot(times, positions, 'o-', color='royalblue')
+    labels = [f"{x:.2f}" for x in positions]
+    for t, x, label in zip(times, positions, labels):
+        ax.text(t, x + 4, label, ha='center', fontsize=9, color='royalblue')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Position x (m)')
+    ax.set_title('Position vs Time')
+    ax.grid(True, linestyle=':')
+    fig.tight_layout()
     plt.show()
 
-def motion_diagram_lcv(n_points=6, x0=0, v0=10, a=1.0, dt=1):
+def motion_diagram_lcv(n_points=6, x0=0, v0=10, a=1.0, dt=1,
+                       times=None, velocities=None):
     """
     Plot velocity vs time for an object with constant acceleration.
+    Pass both times and velocities from _kinematics(), or neither.
     """
-    times = np.arange(n_points) * dt
-    velocities = v0 + a * times
-    plt.figure(figsize=(6, 3))
-    plt.plot(times, velocities, 'o-', color='green')
-    for t, v in zip(times, velocities):
-        plt.text(t, v + 1, f"{v:.2f}", ha='center', fontsize=9, color='green')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Velocity v (m/s)')
-    plt.title('Velocity vs Time')
-    plt.grid(True, linestyle=':')
-    plt.tight_layout()
+    if times is None and velocities is None:
+        times, _, velocities = _kinematics(n_points, x0, v0, a, dt)
+    elif times is None or velocities is None:
+        raise ValueError("pass both times and velocities, or neither")
+    fig, ax = plt.subplots(figsize=(6, 3))
+    ax.plot(times, velocities, 'o-', color='green')
+    labels = [f"{v:.2f}" for v in velocities]
+    for t, v, label in zip(times, velocities, labels):
+        ax.text(t, v + 1, label, ha='center', fontsize=9, color='green')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Velocity v (m/s)')
+    ax.set_title('Velocity vs Time')
+    ax.grid(True, linestyle=':')
+    fig.tight_layout()
     plt.show()
 
 def motion_diagram(n_points=6, x0=0, v0=10, a=1.0, dt=1):
-    motion_diagram_tl(n_points=n_points, x0=x0, v0=v0, a=a, dt=dt)
-    motion_diagram_lcx(n_points=n_points, x0=x0, v0=v0, a=a, dt=dt)
-    motion_diagram_lcv(n_points=n_points, x0=x0, v0=v0, a=a, dt=dt)
\ No newline at end of file
+    times, positions, velocities = _kinematics(n_points, x0, v0, a, dt)
+    motion_diagram_tl(times=times, positions=positions, velocities=velocities)
+    motion_diagram_lcx(times=times, positions=positions)
+    motion_diagram_lcv(times=times, velocities=velocities)
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+physics_kernels.py
+
+Compiled physics steps for the Physics for Games programs.
+
+Each function advances a simulation of many bodies by a single time step. The
+state is kept in NumPy arrays that the function changes in place, so Numba
+can compile the loop over the bodies to machine code. Drawing and keyboard
+handling stay in the programs themselves, because Numba cannot call pygame.
+Programs that move just one or two bodies keep their physics inline, where
+students can read and change it.
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def step_pool(pos, vel, gravity, width, height, size, d_t, elasticity):
+    """
+    Advance a pool of falling, bouncing squares by one time step.
+
+    Does the work of BodyPool.apply_gravity(), update(),
+    check_wall_collision() and check_ground_collision() in a single pass over
+    the bodies. Gravity is the only force, so no acceleration array is needed.
+
+    Args:
+        pos (np.ndarray): (N, 2) top left corners of the squares; updated in place.
+        vel (np.ndarray): (N, 2) velocities; updated in place.
+        gravity (float): Downward acceleration.
+        width (float): Width of the screen.
+        height (float): Height of the screen.
+        size (float): Side length of each square.
+        d_t (float): Time step.
+        elasticity (float): Fraction of the speed kept after a bounce.
+    """
+    max_x = width - size
+    max_y = height - size
+    d_v_y = gravity * d_t
+
+    for i in range(pos.shape[0]):
+        # Apply gravity, then move
+        vel[i, 1] += d_v_y
+        pos[i, 0] += vel[i, 0] * d_t
+        pos[i, 1] += vel[i, 1] * d_t
+
+        # Bounce off walls (left and right)
+        if pos[i, 0] < 0:
+            pos[i, 0] = 0
+            vel[i, 0] = -elasticity * vel[i, 0]
+        elif pos[i, 0] > max_x:
+            pos[i, 0] = max_x
+            vel[i, 0] = -elasticity * vel[i, 0]
+
+        # Bounce off floor
+        if pos[i, 1] > max_y:
+            pos[i, 1] = max_y
+            vel[i, 1] = -elasticity * vel[i, 1]
@@ -18,6 +18,11 @@ BLUE = (0, 0, 255)
 GREEN = (0, 100, 0)
 GRAY = (128, 128, 128)
 
+# Arrowheads are two 10 pixel lines, each 30 degrees to one side of the vector
+ARROW_LENGTH = 10
+ARROW_COS = math.cos(math.pi / 6)
+ARROW_SIN = math.sin(math.pi / 6)
+
 
 # Factory function to create the Vector20 class with customizable screen size and scale
 def Vector20Factory(screen_width=800, screen_height=600, scale=20):
@@ -70,6 +75,10 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
             self.orig_x = x
             self.orig_y = y
 
+    # Font for the vector labels, made on first use because pygame may not
+    # be initialized yet when the factory is called
+    label_font = None
+
     def drawv20(screen, start_o, end_o):
         """
         Draw a vector from start_o to end_o on the given pygame screen.
@@ -88,20 +97,20 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         start = origin + start_o
         end = end_o + start
 
-        print("Draw from ", start, " to ", end)
         pygame.draw.line(screen, BLACK, start, end, 3)  # Line from start to end
 
-        # Calculate the arrowhead
-        arrow_length = 10  # Length of the arrowhead lines
-        angle = math.atan2(end.y - start.y, end.x - start.x)  # Angle of the vector
-        left_arrow = pygame.math.Vector2(
-            end.x - arrow_length * math.cos(angle - math.pi / 6),
-            end.y - arrow_length * math.sin(angle - math.pi / 6),
-        )
-        right_arrow = pygame.math.Vector2(
-            end.x - arrow_length * math.cos(angle + math.pi / 6),
-            end.y - arrow_length * math.sin(angle + math.pi / 6),
-        )
+        # Calculate the arrowhead from the unit vector along the line, and
+        # the unit vector perpendicular to it
+        direction = end - start
+        if direction.length_squared() > 0:
+            direction.normalize_ip()
+        else:
+            direction = pygame.math.Vector2(1, 0)  # No direction; point the arrow right
+
+        along = direction * (ARROW_LENGTH * ARROW_COS)
+        across = pygame.math.Vector2(-direction.y, direction.x) * (ARROW_LENGTH * ARROW_SIN)
+        left_arrow = end - along + across
+        right_arrow = end - along - across
 
         # Draw the arrowhead (two lines forming a 'V')
         pygame.draw.line(screen, BLACK, end, left_arrow, 3)
@@ -111,14 +120,16 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         mid_x = (start.x + end.x) / 2
         mid_y = (start.y + end.y) / 2
 
-        # Create a font object
-        font = pygame.font.SysFont(None, 24)
+        # Create the font object the first time a vector is drawn
+        nonlocal label_font
+        if label_font is None:
+            label_font = pygame.font.SysFont(None, 24)
 
         disp_x = end_o.x // scale
         disp_y = -end_o.y // scale # - to undo effect of display scaling
 
         # Render the text with white background
-        text_surface = font.render(f"({disp_x:.1f}, {disp_y:.1f})", True, BLUE, WHITE)
+        text_surface = label_font.render(f"({disp_x:.1f}, {disp_y:.1f})", True, BLUE, WHITE)
         text_rect = text_surface.get_rect(center=(mid_x, mid_y))
 
         # Draw the text on the screen at the midpoint of the line
@@ -139,12 +150,13 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         center_x = screen_width // 2
         center_y = screen_height // 2
 
-        # Draw vertical lines
+        # Draw vertical lines. Filling a one pixel wide rectangle sets the
+        # same pixels as a thin line, and is a plain memory fill in SDL.
         for x in range(0, screen_width, scale):
-            pygame.draw.line(screen, GRAY, (x, 0), (x, screen_height))
+            screen.fill(GRAY, (x, 0, 1, screen_height))
         # Draw horizontal lines
         for y in range(0, screen_height, scale):
-            pygame.draw.line(screen, GRAY, (0, y), (screen_width, y))
+            screen.fill(GRAY, (0, y, screen_width, 1))
 
         # Draw center lines in black
         pygame.draw.line(
@@ -166,43 +178,40 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
 
         font = pygame.font.SysFont(None, 16)
 
+        # Most numbers label both a vertical and a horizontal line, so render
+        # each one once
+        labels = {}
+
+        def label_for(line_number):
+            label = labels.get(line_number)
+            if label is None:
+                label = font.render(str(line_number), True, GREEN)
+                labels[line_number] = label
+            return label
+
         # Label vertical lines at y=0
         for x in range(0, screen_width, scale):
             line_number = (x - center_x) // scale
             if line_number != 0:  # Skip the center line label
-                label = font.render(str(line_number), True, GREEN)
-                label_rect = label.get_rect()
+                label = label_for(line_number)
+                label_rect = label.get_rect(midtop=(x, center_y + 5))
                 # Draw the label with white background buffer
-                pygame.draw.rect(
-                    screen,
-                    WHITE,
-                    (
-                        x - label_rect.width // 2,
-                        center_y + 5,
-                        label_rect.width,
-                        label_rect.height,
-                    ),
-                )
-                screen.blit(label, (x - label_rect.width // 2, center_y + 5))
+                pygame.draw.rect(screen, WHITE, label_rect)
+                screen.blit(label, label_rect)
 
         # Label horizontal lines at x=0
         for y in range(0, screen_height, scale):
             line_number = (center_y - y) // scale
             if line_number != 0:  # Skip the center line label
-                label = font.render(str(line_number), True, GREEN)
-                label_rect = label.get_rect()
+                label = label_for(line_number)
+                label_rect = label.get_rect(midleft=(center_x + 5, y))
                 # Draw the label with white background buffer
-                pygame.draw.rect(
-                    screen,
-                    WHITE,
-                    (
-                        center_x + 5,
-                        y - label_rect.height // 2,
-                        label_rect.width,
-                        label_rect.height,
-                    ),
-                )
-                screen.blit(label, (center_x + 5, y - label_rect.height // 2))
+                pygame.draw.rect(screen, WHITE, label_rect)
+                screen.blit(label, label_rect)
+
+    # The grid and its labels never change, so they are drawn once onto this
+    # surface, which is then copied to the screen by every draw_grid call.
+    grid_surface = None
 
     def draw_grid(screen):
         """
@@ -211,8 +220,13 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        screen.fill((255, 255, 255))
-        _draw_grid(screen)
-        _label_lines(screen)
+        nonlocal grid_surface
+
+        if grid_surface is None:
+            grid_surface = pygame.Surface((screen_width, screen_height)).convert(screen)
+            _draw_grid(grid_surface)
+            _label_lines(grid_surface)
+
+        screen.blit(grid_surface, (0, 0))
 
     return Vector20, drawv20, draw_grid